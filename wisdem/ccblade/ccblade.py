@@ -459,6 +459,12 @@ class CCAirfoil(object):
 
 
 class CCBlade(object):
+    # unit seed directions for the Tapenade routines (only read, never written, so shared across calls)
+    _dx_dx = np.eye(9)
+    _dx_dx.flags.writeable = False
+    _dalpha_dx = np.array([1.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0])
+    _dalpha_dx.flags.writeable = False
+
     def __init__(
         self,
         r,
@@ -608,9 +614,15 @@ class CCBlade(object):
         else:
             self.nSector = max(4, nSector)  # at least 4 are necessary
 
+        # sector azimuths (evenly spaced, starting at 0) and their trig, fixed for the life of the instance
+        self._azimuth_angles = np.arange(self.nSector) * (2 * np.pi / self.nSector)
+        self._azimuth_cos = np.cos(self._azimuth_angles)
+        self._azimuth_sin = np.sin(self._azimuth_angles)
+
         self.inverse_analysis = False
         self.induction = False
         self.induction_inflow = False
+        self._dy_dy = None  # wind component seed matrix, built on first derivative call
 
     # residual
     def __runBEM(self, phi, r, chord, theta, af, Vx, Vy):
@@ -672,7 +684,7 @@ class CCBlade(object):
         ap = 0.0
         alpha, W, Re = _bem.relativewind(phi, a, ap, Vx, Vy, self.pitch, chord, theta, self.rho, self.mu)
 
-        dalpha_dx = np.array([1.0, 0.0, -1.0, 0.0, 0.0, 0.0, 0.0, 0.0, -1.0])
+        dalpha_dx = self._dalpha_dx
         dRe_dx = np.array([0.0, Re / chord, 0.0, Re * Vx / W**2, Re * Vy / W**2, 0.0, 0.0, 0.0, 0.0])
 
         # cl, cd (spline derivatives)
@@ -684,7 +696,7 @@ class CCBlade(object):
         dcd_dx = dcd_dalpha * dalpha_dx + dcd_dRe * dRe_dx
 
         # residual, a, ap (Tapenade)
-        dx_dx = np.eye(9)
+        dx_dx = self._dx_dx
 
         fzero, dR_dx, a, da_dx, ap, dap_dx = _bem.inductionfactors_dv(
             r,
@@ -740,7 +752,7 @@ class CCBlade(object):
                 # derivative of residual function
                 if rotating:
                     dR_dx, da_dx, dap_dx = self.__residualDerivatives(phi, r, chord, theta, af, Vx, Vy)
-                    dphi_dx = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+                    dphi_dx = self._dx_dx[0]
                 else:
                     dR_dx = np.zeros(9)
                     dR_dx[0] = 1.0  # just to prevent divide by zero
@@ -749,8 +761,8 @@ class CCBlade(object):
                     dphi_dx = np.zeros(9)
 
                 # x = [phi, chord, theta, Vx, Vy, r, Rhub, Rtip, pitch]  (derivative order)
-                dx_dx = np.eye(9)
-                dchord_dx = np.array([0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+                dx_dx = self._dx_dx
+                dchord_dx = dx_dx[1]
 
                 # alpha, W, Re (Tapenade)
 
@@ -828,7 +840,9 @@ class CCBlade(object):
 
         # y = [r, precurve, presweep, precone, tilt, hubHt, yaw, shear, azimuth, Uinf, Omega]  (derivative order)
         n = len(self.r)
-        dy_dy = np.eye(3 * n + 8)
+        dy_dy = self._dy_dy
+        if dy_dy is None or dy_dy.shape[0] != 3 * n + 8:
+            dy_dy = self._dy_dy = np.eye(3 * n + 8)
 
         _, Vxd, _, Vyd = _bem.windcomponents_dv(
             self.r,
@@ -1256,61 +1270,74 @@ class CCBlade(object):
             dMz_dv = np.zeros((npts, 5, nr))
             dMb_dv = np.zeros((npts, 5, nr))
 
-        azimuth_angles = np.linspace(0.0, 2 * np.pi, nsec + 1)[:-1]
+        azimuth_degs = np.rad2deg(self._azimuth_angles)
+        ca = self._azimuth_cos
+        sa = self._azimuth_sin
+        # azimuth to hub rotation terms shaped once for the sector stacks of the derivatives
+        ca_s = ca[:, np.newaxis]
+        sa_s = sa[:, np.newaxis]
+        ca_v = ca[:, np.newaxis, np.newaxis]
+        sa_v = sa[:, np.newaxis, np.newaxis]
         for i in range(npts):  # iterate across conditions
-            for azimuth in azimuth_angles:  # integrate across azimuth
-                ca = np.cos(azimuth)
-                sa = np.sin(azimuth)
-
-                # contribution from this azimuthal location
-                loads, derivs = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], np.rad2deg(azimuth))
+            # contribution from each azimuthal location, stacked along the first axis
+            sub = []
+            dsub = []
+            for azimuth in azimuth_degs:
+                loads, derivs = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], azimuth)
                 Np, Tp, W = (loads["Np"], loads["Tp"], loads["W"])
 
-                Tsub, Ysub, Zsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
-
-                # Scale rotor quantities (thrust & torque) by num blades.  Keep blade root moment as is
-                T[i] += self.B * Tsub / nsec
-                Y[i] += self.B * (Ysub * ca - Zsub * sa) / nsec
-                Z[i] += self.B * (Zsub * ca + Ysub * sa) / nsec
-                Q[i] += self.B * Qsub / nsec
-                My[i] += self.B * Msub * ca / nsec
-                Mz[i] += self.B * Msub * sa / nsec
-                Mb[i] += Msub / nsec
+                sub.append(_bem.thrusttorque(Np, Tp, *args))
 
                 if self.derivatives:
-                    # dNp = derivs["dNp"]
-                    # dTp = derivs["dTp"]
-
-                    (
-                        dT_ds_sub,
-                        dY_ds_sub,
-                        dZ_ds_sub,
-                        dQ_ds_sub,
-                        dM_ds_sub,
-                        dT_dv_sub,
-                        dY_dv_sub,
-                        dZ_dv_sub,
-                        dQ_dv_sub,
-                        dM_dv_sub,
-                    ) = self.__thrustTorqueDeriv(
-                        Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args
+                    dsub.append(
+                        self.__thrustTorqueDeriv(
+                            Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args
+                        )
                     )
 
-                    dT_ds[i, :] += self.B * dT_ds_sub / nsec
-                    dY_ds[i, :] += self.B * (dY_ds_sub * ca - dZ_ds_sub * sa) / nsec
-                    dZ_ds[i, :] += self.B * (dZ_ds_sub * ca + dY_ds_sub * sa) / nsec
-                    dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
-                    dMy_ds[i, :] += self.B * dM_ds_sub * ca / nsec
-                    dMz_ds[i, :] += self.B * dM_ds_sub * sa / nsec
-                    dMb_ds[i, :] += dM_ds_sub / nsec
-
-                    dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
-                    dY_dv[i, :, :] += self.B * (dY_dv_sub * ca - dZ_dv_sub * sa) / nsec
-                    dZ_dv[i, :, :] += self.B * (dZ_dv_sub * ca + dY_dv_sub * sa) / nsec
-                    dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
-                    dMy_dv[i, :, :] += self.B * dM_dv_sub * ca / nsec
-                    dMz_dv[i, :, :] += self.B * dM_dv_sub * sa / nsec
-                    dMb_dv[i, :, :] += dM_dv_sub / nsec
+            # Integrate across azimuth, rotating the in-plane components of every sector to the hub c.s. at once.
+            # Scale rotor quantities (thrust & torque) by num blades.  Keep blade root moment as is
+            # (summing along the sector axis keeps the azimuthal order of the additions)
+            Tsub, Ysub, Zsub, Qsub, Msub = np.array(sub).T
+            T[i], Y[i], Z[i], Q[i], My[i], Mz[i], Mb[i] = np.c_[
+                self.B * Tsub / nsec,
+                self.B * (Ysub * ca - Zsub * sa) / nsec,
+                self.B * (Zsub * ca + Ysub * sa) / nsec,
+                self.B * Qsub / nsec,
+                self.B * Msub * ca / nsec,
+                self.B * Msub * sa / nsec,
+                Msub / nsec,
+            ].sum(axis=0)
+
+            if self.derivatives:
+                (
+                    dT_ds_sub,
+                    dY_ds_sub,
+                    dZ_ds_sub,
+                    dQ_ds_sub,
+                    dM_ds_sub,
+                    dT_dv_sub,
+                    dY_dv_sub,
+                    dZ_dv_sub,
+                    dQ_dv_sub,
+                    dM_dv_sub,
+                ) = [np.array(d) for d in zip(*dsub)]
+
+                dT_ds[i, :] = (self.B * dT_ds_sub / nsec).sum(axis=0)
+                dY_ds[i, :] = (self.B * (dY_ds_sub * ca_s - dZ_ds_sub * sa_s) / nsec).sum(axis=0)
+                dZ_ds[i, :] = (self.B * (dZ_ds_sub * ca_s + dY_ds_sub * sa_s) / nsec).sum(axis=0)
+                dQ_ds[i, :] = (self.B * dQ_ds_sub / nsec).sum(axis=0)
+                dMy_ds[i, :] = (self.B * dM_ds_sub * ca_s / nsec).sum(axis=0)
+                dMz_ds[i, :] = (self.B * dM_ds_sub * sa_s / nsec).sum(axis=0)
+                dMb_ds[i, :] = (dM_ds_sub / nsec).sum(axis=0)
+
+                dT_dv[i, :, :] = (self.B * dT_dv_sub / nsec).sum(axis=0)
+                dY_dv[i, :, :] = (self.B * (dY_dv_sub * ca_v - dZ_dv_sub * sa_v) / nsec).sum(axis=0)
+                dZ_dv[i, :, :] = (self.B * (dZ_dv_sub * ca_v + dY_dv_sub * sa_v) / nsec).sum(axis=0)
+                dQ_dv[i, :, :] = (self.B * dQ_dv_sub / nsec).sum(axis=0)
+                dMy_dv[i, :, :] = (self.B * dM_dv_sub * ca_v / nsec).sum(axis=0)
+                dMz_dv[i, :, :] = (self.B * dM_dv_sub * sa_v / nsec).sum(axis=0)
+                dMb_dv[i, :, :] = (dM_dv_sub / nsec).sum(axis=0)
 
         # Power
         P = Q * Omega * np.pi / 30.0  # RPM to rad/s
@@ -3,12 +3,33 @@ from openmdao.api import ExplicitComponent
 from scipy.interpolate import PchipInterpolator
 
 import wisdem.ccblade._bem as _bem
+import wisdem.commonse.utilities as util
 from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
 from wisdem.commonse.csystem import DirectionVector
 
 cosd = lambda x: np.cos(np.deg2rad(x))
 sind = lambda x: np.sin(np.deg2rad(x))
 
+_airfoil_inputs = ("airfoils_aoa", "airfoils_Re", "airfoils_cl", "airfoils_cd", "airfoils_cm")
+
+
+def _span_airfoils(comp, inputs):
+    """CCAirfoil for every span station from the first polar table, only refit when the polars change"""
+
+    def fit(inputs):
+        return [
+            CCAirfoil(
+                inputs["airfoils_aoa"],
+                inputs["airfoils_Re"],
+                inputs["airfoils_cl"][i, :, :, 0],
+                inputs["airfoils_cd"][i, :, :, 0],
+                inputs["airfoils_cm"][i, :, :, 0],
+            )
+            for i in range(comp.n_span)
+        ]
+
+    return util.memo_inputs(comp, _airfoil_inputs, inputs, fit)
+
 
 class CCBladeGeometry(ExplicitComponent):
     """
@@ -231,13 +252,10 @@ class CCBladeLoads(ExplicitComponent):
                 "Rtip",
                 "V_load",
                 "azimuth_load",
-                "chord",
                 "hub_height",
                 "pitch_load",
                 "precone",
                 "precurve",
-                "r",
-                "theta",
                 "tilt",
                 "yaw",
                 "shearExp",
@@ -251,18 +269,17 @@ class CCBladeLoads(ExplicitComponent):
                 "Rtip",
                 "V_load",
                 "azimuth_load",
-                "chord",
                 "hub_height",
                 "pitch_load",
                 "precone",
                 "precurve",
-                "r",
-                "theta",
                 "tilt",
                 "yaw",
                 "shearExp",
             ],
         )
+        # Sectional loads only depend on the local radius, chord and twist
+        self.declare_partials(["loads_Px", "loads_Py"], ["chord", "r", "theta"], rows=arange, cols=arange)
         self.declare_partials("loads_Pz", "*", dependent=False)
         self.declare_partials("loads_r", "r", val=1.0, rows=arange, cols=arange)
         self.declare_partials("*", "airfoils*", dependent=False)
@@ -297,15 +314,7 @@ class CCBladeLoads(ExplicitComponent):
             precurve = np.zeros_like(r)
 
         # airfoil files
-        af = [None] * self.n_span
-        for i in range(self.n_span):
-            af[i] = CCAirfoil(
-                inputs["airfoils_aoa"],
-                inputs["airfoils_Re"],
-                inputs["airfoils_cl"][i, :, :, 0],
-                inputs["airfoils_cd"][i, :, :, 0],
-                inputs["airfoils_cm"][i, :, :, 0],
-            )
+        af = _span_airfoils(self, inputs)
 
         ccblade = CCBlade(
             r,
@@ -349,9 +358,9 @@ class CCBladeLoads(ExplicitComponent):
         dNp = self.derivs["dNp"]
         dTp = self.derivs["dTp"]
 
-        J["loads_Px", "r"] = dNp["dr"]
-        J["loads_Px", "chord"] = dNp["dchord"]
-        J["loads_Px", "theta"] = dNp["dtheta"]
+        J["loads_Px", "r"] = np.diag(dNp["dr"])
+        J["loads_Px", "chord"] = np.diag(dNp["dchord"])
+        J["loads_Px", "theta"] = np.diag(dNp["dtheta"])
         J["loads_Px", "Rhub"] = np.squeeze(dNp["dRhub"])
         J["loads_Px", "Rtip"] = np.squeeze(dNp["dRtip"])
         J["loads_Px", "hub_height"] = np.squeeze(dNp["dhubHt"])
@@ -365,9 +374,9 @@ class CCBladeLoads(ExplicitComponent):
         J["loads_Px", "azimuth_load"] = np.squeeze(dNp["dazimuth"])
         J["loads_Px", "precurve"] = dNp["dprecurve"]
 
-        J["loads_Py", "r"] = -dTp["dr"]
-        J["loads_Py", "chord"] = -dTp["dchord"]
-        J["loads_Py", "theta"] = -dTp["dtheta"]
+        J["loads_Py", "r"] = -np.diag(dTp["dr"])
+        J["loads_Py", "chord"] = -np.diag(dTp["dchord"])
+        J["loads_Py", "theta"] = -np.diag(dTp["dtheta"])
         J["loads_Py", "Rhub"] = -np.squeeze(dTp["dRhub"])
         J["loads_Py", "Rtip"] = -np.squeeze(dTp["dRtip"])
         J["loads_Py", "hub_height"] = -np.squeeze(dTp["dhubHt"])
@@ -628,6 +637,9 @@ class CCBladeTwist(ExplicitComponent):
         else:
             ccblade.theta = inputs["theta_in"]
 
+        # Normalized span used to map to and from the optimization grid
+        s = (inputs["r"] - inputs["r"][0]) / (inputs["r"][-1] - inputs["r"][0])
+
         # Smooth out twist profile if we're doing inverse and inn_af design
         if (
             self.options["opt_options"]["design_variables"]["blade"]["aero_shape"]["twist"]["inverse"]
@@ -635,7 +647,6 @@ class CCBladeTwist(ExplicitComponent):
         ):
             n_opt = self.options["opt_options"]["design_variables"]["blade"]["aero_shape"]["twist"]["n_opt"]
             training_theta = np.copy(ccblade.theta)
-            s = (inputs["r"] - inputs["r"][0]) / (inputs["r"][-1] - inputs["r"][0])
 
             twist_spline = PchipInterpolator(s, training_theta)
             theta_opt = twist_spline(inputs["s_opt_theta"])
@@ -674,7 +685,6 @@ class CCBladeTwist(ExplicitComponent):
         outputs["alpha"] = loads["alpha"]
         outputs["cl"] = loads["Cl"]
         outputs["cd"] = loads["Cd"]
-        s = (inputs["r"] - inputs["r"][0]) / (inputs["r"][-1] - inputs["r"][0])
         outputs["cl_n_opt"] = np.interp(inputs["s_opt_theta"], s, loads["Cl"])
         outputs["cd_n_opt"] = np.interp(inputs["s_opt_theta"], s, loads["Cd"])
         # Forces in the blade coordinate system, pag 21 of https://www.nrel.gov/docs/fy13osti/58819.pdf
@@ -682,13 +692,14 @@ class CCBladeTwist(ExplicitComponent):
         outputs["Py_b"] = -loads["Tp"]
         outputs["Pz_b"] = 0 * loads["Np"]
         # Forces in the airfoil coordinate system, pag 21 of https://www.nrel.gov/docs/fy13osti/58819.pdf
+        theta_deg = ccblade.theta * 180.0 / np.pi
         P_b = DirectionVector(loads["Np"], -loads["Tp"], 0)
-        P_af = P_b.bladeToAirfoil(ccblade.theta * 180.0 / np.pi)
+        P_af = P_b.bladeToAirfoil(theta_deg)
         outputs["Px_af"] = P_af.x
         outputs["Py_af"] = P_af.y
         outputs["Pz_af"] = P_af.z
         # Lift and drag forces
-        F = P_b.bladeToAirfoil(ccblade.theta * 180.0 / np.pi + loads["alpha"] + inputs["pitch"])
+        F = P_b.bladeToAirfoil(theta_deg + loads["alpha"] + inputs["pitch"])
         outputs["LiftF"] = F.x
         outputs["DragF"] = F.y
         outputs["L_n_opt"] = np.interp(inputs["s_opt_theta"], s, F.x)
@@ -796,15 +807,7 @@ class CCBladeEvaluate(ExplicitComponent):
             precurve = np.zeros_like(r)
 
         # airfoil files
-        af = [None] * self.n_span
-        for i in range(self.n_span):
-            af[i] = CCAirfoil(
-                inputs["airfoils_aoa"],
-                inputs["airfoils_Re"],
-                inputs["airfoils_cl"][i, :, :, 0],
-                inputs["airfoils_cd"][i, :, :, 0],
-                inputs["airfoils_cm"][i, :, :, 0],
-            )
+        af = _span_airfoils(self, inputs)
 
         ccblade = CCBlade(
             r,
@@ -874,15 +877,7 @@ class CCBladeEvaluate(ExplicitComponent):
             precurve = np.zeros_like(r)
 
         # airfoil files
-        af = [None] * self.n_span
-        for i in range(self.n_span):
-            af[i] = CCAirfoil(
-                inputs["airfoils_aoa"],
-                inputs["airfoils_Re"],
-                inputs["airfoils_cl"][i, :, :, 0],
-                inputs["airfoils_cd"][i, :, :, 0],
-                inputs["airfoils_cm"][i, :, :, 0],
-            )
+        af = _span_airfoils(self, inputs)
 
         ccblade = CCBlade(
             r,
@@ -203,27 +203,14 @@ class Akima(object):
         xcp = self.xpt
         ncp = np.size(xcp)
         n = np.size(x)
-        vec_size = self.p0.shape[0]
 
         p0 = self.p0
         p1 = self.p1
         p2 = self.p2
         p3 = self.p3
 
-        # All vectorized points uses same grid, so find these once.
-        j_idx = np.zeros(n, dtype=np.int_)
-        for i in range(n):
-            # Find location in array (use end segments if out of bounds)
-            if x[i] < xcp[0]:
-                j = 0
-
-            else:
-                # Linear search for now
-                for j in range(ncp - 2, -1, -1):
-                    if x[i] >= xcp[j]:
-                        break
-
-            j_idx[i] = j
+        # All vectorized points uses same grid, so find these once (use end segments if out of bounds)
+        j_idx = np.clip(np.searchsorted(xcp, x, side="right") - 1, 0, ncp - 2)
 
         dx = x - xcp[j_idx]
         dx2 = dx * dx
@@ -241,10 +228,7 @@ class Akima(object):
             + np.einsum("kij,i->kij", self.dp3_dxcp[:, j_idx, :], dx3)
         )
 
-        for jj in range(vec_size):
-            for i in range(n):
-                j = j_idx[i]
-                dydxcp[jj, i, j] -= dydx[jj, i]
+        dydxcp[:, np.arange(n), j_idx] -= dydx
 
         dydycp = (
             self.dp0_dycp[:, j_idx, :]
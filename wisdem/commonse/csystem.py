@@ -106,34 +106,22 @@ class DirectionVector(object):
         ynew = -x * s + y * c
         znew = z
 
-        angles = []
-        for key in dx.keys():
-            if not key in ["dx", "dy", "dz"]:
-                angles.append(key)
-
+        # Every existing derivative is rotated by the same 2x2 matrix, then the new angle is appended
+        # (an angle that is already tracked keeps its rotated derivative)
         dxnew = {}
-        dxnew["dx"] = dx["dx"] * c + dy["dx"] * s
-        dxnew["dy"] = dx["dy"] * c + dy["dy"] * s
-        dxnew["dz"] = dx["dz"] * c + dy["dz"] * s
-        dxnew["d" + thetaname] = (-x * s + y * c) * np.radians(thetaM)
-        for dangle in angles:
-            dxnew[dangle] = dx[dangle] * c + dy[dangle] * s
-
         dynew = {}
-        dynew["dx"] = -dx["dx"] * s + dy["dx"] * c
-        dynew["dy"] = -dx["dy"] * s + dy["dy"] * c
-        dynew["dz"] = -dx["dz"] * s + dy["dz"] * c
-        dynew["d" + thetaname] = (-x * c - y * s) * np.radians(thetaM)
-        for dangle in angles:
-            dynew[dangle] = -dx[dangle] * s + dy[dangle] * c
-
         dznew = {}
-        dznew["dx"] = dz["dx"] * np.ones_like(theta)  # multiply by ones just to get right size in case of float
-        dznew["dy"] = dz["dy"] * np.ones_like(theta)
-        dznew["dz"] = dz["dz"] * np.ones_like(theta)
-        dznew["d" + thetaname] = np.zeros_like(theta)
-        for dangle in angles:
-            dznew[dangle] = dz[dangle]
+        for key in dx.keys():
+            dxnew[key] = dx[key] * c + dy[key] * s
+            dynew[key] = -dx[key] * s + dy[key] * c
+            if key in ["dx", "dy", "dz"]:
+                dznew[key] = dz[key] * np.ones_like(theta)  # multiply by ones just to get right size in case of float
+            else:
+                dznew[key] = dz[key]
+        if "d" + thetaname not in dx:
+            dxnew["d" + thetaname] = ynew * np.radians(thetaM)
+            dynew["d" + thetaname] = -xnew * np.radians(thetaM)
+            dznew["d" + thetaname] = np.zeros_like(theta)
 
         return xnew, ynew, znew, dxnew, dynew, dznew
 
@@ -311,6 +299,31 @@ class DirectionVector(object):
         za, xa, ya, dza, dxa, dya = self._rotateAboutZ("z", "x", "y", Phi, "precone")
         return DirectionVector(xa, ya, za, dxa, dya, dza)
 
+    def bladeToYawAzimuth180(self, Phi, Theta):
+        """Rotates from blade-aligned to yaw-aligned for a blade pointing down (azimuth of 180 deg)
+
+        Same as bladeToAzimuth(Phi).azimuthToHub(180.0).hubToYaw(Theta), but the fixed azimuth rotation
+        reduces to flipping the y and z axes, so no azimuth derivative is added.
+
+        Parameters
+        ----------
+        Phi : float (deg)
+            precone angle
+        Theta : float (deg)
+            tilt angle
+
+        Returns
+        -------
+        vector : DirectionVector
+            a DirectionVector in the yaw-aligned coordinate system
+
+        """
+
+        va = self.bladeToAzimuth(Phi)
+        dyh = {key: -val for key, val in va.dy.items()}
+        dzh = {key: -val for key, val in va.dz.items()}
+        return DirectionVector(va.x, -va.y, -va.z, va.dx, dyh, dzh).hubToYaw(Theta)
+
     def airfoilToBlade(self, theta):
         """Rotates from airfoil-aligned to blade-aligned
 
@@ -17,6 +17,7 @@ from wisdem.commonse.wind_wave_drag import CylinderEnvironment
 NULL = -9999
 MEMMAX = 200
 NREFINE = 1
+EYE3 = np.eye(3)  # read-only identity for the parallel axis shifts in the inertia loops
 
 
 class CrossSection(object):
@@ -722,7 +723,7 @@ class ShellMassCost(om.ExplicitComponent):
             R = np.array([0.0, 0.0, cm_section[k] - zz[0]])
             Icg = util.assembleI([Ixx_section[k], Iyy_section[k], J0_section[k], 0.0, 0.0, 0.0])
 
-            I_base += Icg + mass[k] * (np.dot(R, R) * np.eye(3) - np.outer(R, R))
+            I_base += Icg + mass[k] * (np.dot(R, R) * EYE3 - np.outer(R, R))
 
         outputs["shell_I_base"] = util.unassembleI(I_base)
 
@@ -1207,7 +1208,7 @@ class MemberComplex(om.ExplicitComponent):
             R = np.array([0.0, 0.0, cm_section[k] - zz[0]])
             Icg = util.assembleI([Ixx_section[k], Iyy_section[k], J0_section[k], 0.0, 0.0, 0.0])
 
-            I_base += Icg + mass[k] * (np.dot(R, R) * np.eye(3) - np.outer(R, R))
+            I_base += Icg + mass[k] * (np.dot(R, R) * EYE3 - np.outer(R, R))
 
         outputs["shell_I_base"] = util.unassembleI(I_base)
 
@@ -1338,7 +1339,7 @@ class MemberComplex(om.ExplicitComponent):
         for k in range(nbulk):
             R = np.array([0.0, 0.0, dz[k]])
             Icg = util.assembleI([Ixx[k], Iyy[k], J0[k], 0.0, 0.0, 0.0])
-            I_keel += Icg + m_bulk[k] * (np.dot(R, R) * np.eye(3) - np.outer(R, R))
+            I_keel += Icg + m_bulk[k] * (np.dot(R, R) * EYE3 - np.outer(R, R))
 
         outputs["bulkhead_I_base"] = util.unassembleI(I_keel)
 
@@ -1491,7 +1492,7 @@ class MemberComplex(om.ExplicitComponent):
         for k in range(n_stiff):
             R = np.array([0.0, 0.0, (z_stiff[k] - z_full[0])])
             I_ring = util.assembleI(I_web[k, :] + I_flange[k, :])
-            I_keel += I_ring + m_ring[k] * (np.dot(R, R) * np.eye(3) - np.outer(R, R))
+            I_keel += I_ring + m_ring[k] * (np.dot(R, R) * EYE3 - np.outer(R, R))
         outputs["stiffener_I_base"] = util.unassembleI(I_keel)
 
         # Compute costs based on "Optimum Design of Steel Structures" by Farkas and Jarmai
@@ -1599,7 +1600,7 @@ class MemberComplex(om.ExplicitComponent):
                 for ii in range(npts - 1):
                     R = np.array([0.0, 0.0, cg_pts[ii]])
                     Icg = util.assembleI([Ixx[ii], Iyy[ii], J0[ii], 0.0, 0.0, 0.0])
-                    I_temp += Icg + V_pts[ii] * (np.dot(R, R) * np.eye(3) - np.outer(R, R))
+                    I_temp += Icg + V_pts[ii] * (np.dot(R, R) * EYE3 - np.outer(R, R))
                 I_ballast += rho_ballast[k] * util.unassembleI(I_temp)
             else:
                 outputs["variable_ballast_capacity"] = V_avail[k]
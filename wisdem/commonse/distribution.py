@@ -54,7 +54,8 @@ class WeibullWithMeanCDF(CDFBase):
 
         self.add_input("xbar", shape=1, units="m/s", desc="mean value of distribution")
 
-        self.declare_partials("F", "x")
+        arange = np.arange(self.options["nspline"])
+        self.declare_partials("F", "x", rows=arange, cols=arange)
         self.declare_partials("F", "xbar")
         self.declare_partials("F", "k", method="fd")
 
@@ -67,7 +68,7 @@ class WeibullWithMeanCDF(CDFBase):
         x = inputs["x"]
         k = inputs["k"]
         A = inputs["xbar"] / gamma(1.0 + 1.0 / k)
-        dx = np.diag(np.exp(-((x / A) ** k)) * (x / A) ** (k - 1) * k / A)
+        dx = np.exp(-((x / A) ** k)) * (x / A) ** (k - 1) * k / A
         dxbar = -np.exp(-((x / A) ** k)) * (x / A) ** (k - 1) * k * x / A**2 / gamma(1.0 + 1.0 / k)
 
         J["F", "x"] = dx
@@ -85,7 +86,8 @@ class RayleighCDF(CDFBase):
         # variables
         self.add_input("xbar", shape=1, units="m/s", desc="reference wind speed (usually at hub height)")
 
-        self.declare_partials("F", "x")
+        arange = np.arange(self.options["nspline"])
+        self.declare_partials("F", "x", rows=arange, cols=arange)
         self.declare_partials("F", "xbar")
 
     def compute(self, inputs, outputs):
@@ -94,7 +96,7 @@ class RayleighCDF(CDFBase):
     def compute_partials(self, inputs, J):
         x = inputs["x"]
         xbar = inputs["xbar"]
-        dx = np.diag(np.exp(-np.pi / 4.0 * (x / xbar) ** 2) * np.pi * x / (2.0 * xbar**2))
+        dx = np.exp(-np.pi / 4.0 * (x / xbar) ** 2) * np.pi * x / (2.0 * xbar**2)
         dxbar = -np.exp(-np.pi / 4.0 * (x / xbar) ** 2) * np.pi * x**2 / (2.0 * xbar**3)
 
         J["F", "x"] = dx
@@ -154,7 +154,9 @@ class PowerWind(WindBase):
         # parameters
         self.add_input("shearExp", 0.0)
 
-        self.declare_partials("U", ["Uref", "z", "zref"])
+        arange = np.arange(self.options["nPoints"])
+        self.declare_partials("U", ["Uref", "zref"])
+        self.declare_partials("U", "z", rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
         # rename
@@ -206,7 +208,7 @@ class PowerWind(WindBase):
         dU_dzref[idx] = -U[idx] * shearExp / (zref - z0)
 
         J["U", "Uref"] = dU_dUref
-        J["U", "z"] = np.diag(dU_dz)
+        J["U", "z"] = dU_dz
         J["U", "zref"] = dU_dzref
         # TODO still missing several partials? This is what was in the original code though...
 
@@ -257,7 +259,9 @@ class LogWind(WindBase):
         # parameters
         self.add_input("z_roughness", 1e-3, units="mm")
 
-        self.declare_partials("U", ["Uref", "z", "zref"])
+        arange = np.arange(self.options["nPoints"])
+        self.declare_partials("U", ["Uref", "zref"])
+        self.declare_partials("U", "z", rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
         # rename
@@ -296,7 +300,7 @@ class LogWind(WindBase):
         dU_dzref[idx] = -Uref * lt / np.log((zref - z0) / z_roughness) ** 2 / (zref - z0)
 
         J["U", "Uref"] = dU_dUref
-        J["U", "z"] = np.diag(dU_dz_diag)
+        J["U", "z"] = dU_dz_diag
         J["U", "zref"] = dU_dzref
 
 
@@ -349,11 +353,10 @@ class LinearWaves(WaveBase):
         # For Ansys AQWA connection
         self.add_output("phase_speed", val=0.0, units="m/s")
 
-        self.declare_partials("U", ["Uc", "z"])
-        self.declare_partials("V", ["Uc", "z"])
-        self.declare_partials("W", ["Uc", "z"])
-        self.declare_partials("A", ["Uc", "z"])
-        self.declare_partials("p", ["Uc", "z"])
+        # W, A and p do not depend on the current, so those partials are left undeclared (always zero)
+        arange = np.arange(self.options["nPoints"])
+        self.declare_partials(["U", "V"], "Uc")
+        self.declare_partials(["U", "V", "W", "A", "p"], "z", rows=arange, cols=arange)
 
     def compute(self, inputs, outputs):
         super(LinearWaves, self).compute(inputs, outputs)
@@ -433,7 +436,6 @@ class LinearWaves(WaveBase):
         dV_dz = 0.5 / outputs["V"] * (2 * outputs["U"] * dU_dz + 2 * outputs["W"] * dW_dz)
         dV_dUc = 0.5 / outputs["V"] * (2 * outputs["U"] * dU_dUc)
         dA_dz = omega * dU_dz
-        dA_dUc = 0.0  # omega*dU_dUc
         dp_dz = inputs["rho_water"] * gravity * (a * np.sinh(k * (z_rel + d)) * k / np.cosh(k * d) - 1.0)
 
         idx = np.logical_or(z < z_floor, z > inputs["z_surface"])
@@ -448,16 +450,13 @@ class LinearWaves(WaveBase):
         # dU0 = np.zeros((1,npts))
         # dA0 = omega * dU0
 
-        J["U", "z"] = np.diag(dU_dz)
+        J["U", "z"] = dU_dz
         J["U", "Uc"] = dU_dUc
-        J["W", "z"] = np.diag(dW_dz)
-        J["W", "Uc"] = 0.0
-        J["V", "z"] = np.diag(dV_dz)
-        J["V", "Uc"] = 0.0
-        J["A", "z"] = np.diag(dA_dz)
-        J["A", "Uc"] = 0.0
-        J["p", "z"] = np.diag(dp_dz)
-        J["p", "Uc"] = 0.0
+        J["W", "z"] = dW_dz
+        J["V", "z"] = dV_dz
+        J["V", "Uc"] = dV_dUc
+        J["A", "z"] = dA_dz
+        J["p", "z"] = dp_dz
         # J['U0', 'z'] = dU0
         # J['U0', 'Uc'] = 1.0
         # J['A0', 'z'] = dA0
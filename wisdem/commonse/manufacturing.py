@@ -5,13 +5,18 @@ from wisdem.commonse import eps
 # Compute costs based on "Optimum Design of Steel Structures" by Farkas and Jarmai
 # All correlations are based in mm and all inputs are assumed to be in m and then converted within the functions
 
+# Better conditioned polynomial fits to the Farkas and Jarmai correlations, shared read-only across calls
+_PLASMA_TIME_FIT = np.array([2.44908121e02, 1.74461814e01, 7.05214799e-02])
+_PLASMA_TIME_FIT.setflags(write=False)
+_CUTGRIND_TIME_FIT = np.array([7.84235859, 0.1428632, 0.07765389])
+_CUTGRIND_TIME_FIT.setflags(write=False)
+
 
 def steel_cutting_plasma_time(length, thickness):
     # Length input as meters, thickness in mm
     # time = length / (-0.180150943 + 41.03815215/(1e3*thickness+eps)) # minutes
     # Better conditioned polynomial fit to the above correlation
-    pp = np.array([2.44908121e02, 1.74461814e01, 7.05214799e-02])
-    time = length * np.polyval(pp, thickness)
+    time = length * np.polyval(_PLASMA_TIME_FIT, thickness)
     return np.sum(time)
 
 
@@ -27,8 +32,7 @@ def steel_tube_cutgrind_time(theta, radius, thickness, angle):
     # Radius and thickness input as meters, converted to mm
     # time = theta * 2.5 * np.pi * (2.0*1e3*radius) / ((350.0 - 2.0*1e3*thickness)*0.3*np.sin(angle))
     # Better conditioned polynomial fit to the above correlation
-    pp = np.array([7.84235859, 0.1428632, 0.07765389])
-    time = theta * (2.0 * 1e3 * radius) / (np.polyval(pp, thickness) * np.sin(angle))
+    time = theta * (2.0 * 1e3 * radius) / (np.polyval(_CUTGRIND_TIME_FIT, thickness) * np.sin(angle))
     return np.sum(time)
 
 
@@ -58,12 +58,11 @@ class TowerModes(om.ExplicitComponent):
         oneP = inputs["rated_Omega"] / 60.0
         threeP = oneP * discrete_inputs["blade_number"]
 
-        outputs["constr_tower_f_NPmargin"] = np.array(
-            [min([threeP - (2 - gamma) * f, gamma * f - threeP]) for f in freq_struct]
-        ).flatten()
-        outputs["constr_tower_f_1Pmargin"] = np.array(
-            [min([oneP - (2 - gamma) * f, gamma * f - oneP]) for f in freq_struct]
-        ).flatten()
+        # Scaled frequencies are shared by the upper and lower margins of both constraints
+        f_lo = (2 - gamma) * freq_struct
+        f_hi = gamma * freq_struct
+        outputs["constr_tower_f_NPmargin"] = np.minimum(threeP - f_lo, f_hi - threeP)
+        outputs["constr_tower_f_1Pmargin"] = np.minimum(oneP - f_lo, f_hi - oneP)
 
 
 class TipDeflectionConstraint(om.ExplicitComponent):
@@ -145,21 +144,13 @@ class TipDeflectionConstraint(om.ExplicitComponent):
         delta = inputs["tip_deflection"]
         prebend_tip = inputs["ref_axis_blade"][-1, 0]  # Defined negative for a standard upwind blade
         presweep_tip = inputs["ref_axis_blade"][-1, 1]  # Defined positive for a standard blade
+        # Downwind rotors mirror precone, tilt and the tip position about the tower
+        coeff = 1.0 if discrete_inputs["rotor_orientation"] == "upwind" else -1.0
+
         # Coordinates of blade tip in yaw c.s.
-        if discrete_inputs["rotor_orientation"] == "upwind":
-            blade_yaw = (
-                DirectionVector(prebend_tip, presweep_tip, inputs["Rtip"])
-                .bladeToAzimuth(precone)
-                .azimuthToHub(180.0)
-                .hubToYaw(tilt)
-            )
-        else:
-            blade_yaw = (
-                DirectionVector(prebend_tip, presweep_tip, inputs["Rtip"])
-                .bladeToAzimuth(-precone)
-                .azimuthToHub(180.0)
-                .hubToYaw(-tilt)
-            )
+        blade_yaw = DirectionVector(prebend_tip, presweep_tip, inputs["Rtip"]).bladeToYawAzimuth180(
+            coeff * precone, coeff * tilt
+        )
 
         # Find the radius of tower where blade passes
         z_interp = z_tower[-1] + tt2hub + blade_yaw.z
@@ -179,10 +170,7 @@ class TipDeflectionConstraint(om.ExplicitComponent):
             drinterp_dtowerd = 0.5 * ddinterp_dtowerd
 
         # Max deflection before strike
-        if discrete_inputs["rotor_orientation"] == "upwind":
-            parked_margin = overhang - blade_yaw.x - r_interp
-        else:
-            parked_margin = overhang + blade_yaw.x - r_interp
+        parked_margin = overhang - coeff * blade_yaw.x - r_interp
         outputs["blade_tip_tower_clearance"] = parked_margin
         outputs["tip_deflection_ratio"] = delta * inputs["max_allowable_td_ratio"] / parked_margin
 
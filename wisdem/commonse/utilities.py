@@ -10,11 +10,10 @@ from __future__ import print_function
 import copy
 
 import numpy as np
-from scipy.linalg import solve_banded
-
-# from scipy.optimize import curve_fit
+from scipy.linalg import solve_banded, solve_triangular
 
 
+# Reference model of the mode shape polynomial, the fit itself is a linear least squares in get_modal_coefficients
 def mode_fit(x, c2, c3, c4, c5, c6):
     return c2 * x**2.0 + c3 * x**3.0 + c4 * x**4.0 + c5 * x**5.0 + c6 * x**6.0
 
@@ -38,8 +37,11 @@ def get_modal_coefficients(x, y, deg=[2, 3, 4, 5, 6], idx0=None, base_slope0=Tru
             dy = np.gradient(y, xn, edge_order=2)
             y = y - dy[idx0] * xn
 
-    # Get coefficients to 2-6th order polynomial
-    p6 = np.polynomial.polynomial.polyfit(xn, y, deg)
+    # Get coefficients to 2-6th order polynomial, one QR of the monomial basis serves every mode
+    deg = np.asarray(deg)
+    Q, R = np.linalg.qr(xn[:, np.newaxis] ** deg[np.newaxis, :])
+    p6 = np.zeros((deg.max() + 1,) + y.shape[1:])
+    p6[deg] = solve_triangular(R, Q.T @ y, check_finite=False)
 
     # Normalize for Elastodyn
     # The normalization shouldn't be less than 1e-5 otherwise OpenFAST has trouble in single prec
@@ -93,29 +95,17 @@ def get_xyz_mode_shapes(
     if not rank_and_file:
         # Identify which mode is which and whether it is a valid mode
         imode = np.argmax(mpfs, axis=1)
-        mpfs_ratio = np.abs(mpfs.max(axis=1) / (1e-16 + mpfs.min(axis=1)))  # Avoid divide by 0
-
-        for m in range(nfreq):
-            if np.isnan(freqs[m]) or (freqs[m] < 1e-1) or (mpfs_ratio[m] < 1e3) or (mpfs[m, :].max() < 1e-13):
-                continue
-            if imode[m] == 0:
-                if expect_all and ix >= nfreq2:
-                    continue
-                mshapes_x[ix, :] = xpolys[m, :]
-                freq_x[ix] = freqs[m]
-                ix += 1
-            elif imode[m] == 1:
-                if expect_all and iy >= nfreq2:
-                    continue
-                mshapes_y[iy, :] = ypolys[m, :]
-                freq_y[iy] = freqs[m]
-                iy += 1
-            elif imode[m] == 2:
-                if expect_all and iz >= nfreq2:
-                    continue
-                mshapes_z[iz, :] = zpolys[m, :]
-                freq_z[iz] = freqs[m]
-                iz += 1
+        mpfs_max = mpfs.max(axis=1)
+        mpfs_ratio = np.abs(mpfs_max / (1e-16 + mpfs.min(axis=1)))  # Avoid divide by 0
+        valid = ~np.isnan(freqs) & (freqs >= 1e-1) & (mpfs_ratio >= 1e3) & (mpfs_max >= 1e-13)
+
+        # Keep the lowest valid modes in each direction, up to the container size
+        for k, (mode_polys, mshapes, freq) in enumerate(
+            [(xpolys, mshapes_x, freq_x), (ypolys, mshapes_y, freq_y), (zpolys, mshapes_z, freq_z)]
+        ):
+            im = np.flatnonzero(valid & (imode == k))[:mysize]
+            mshapes[: im.size, :] = mode_polys[im, :]
+            freq[: im.size] = freqs[im]
     # "Rank and file" the modeshapes by their mpfs and order
     # Filter the modeshapes by their mpfs
     #   - does guarauntees that modeshapes are calculated at different frequencies,
@@ -250,8 +240,12 @@ def arc_length(points):
     array([0.        , 0.59835165, 1.19670329, 1.79505494, 2.39340658,
            2.99175823, 3.59010987, 4.18846152, 4.78681316, 5.38516481])
     """
-    cartesian_distances = np.sqrt(np.sum(np.diff(points, axis=0) ** 2, axis=1))
-    arc_distances = np.r_[0.0, np.cumsum(cartesian_distances)]
+    diff_points = np.diff(points, axis=0)
+    cartesian_distances = np.sqrt(np.einsum("ij,ij->i", diff_points, diff_points))
+
+    # Accumulate straight into the output instead of concatenating a leading zero
+    arc_distances = np.zeros(points.shape[0], dtype=cartesian_distances.dtype)
+    np.cumsum(cartesian_distances, out=arc_distances[1:])
 
     return arc_distances
 
@@ -273,30 +267,20 @@ def arc_length_deriv(points):
         point in the points array along the arc.
     """
     n_points, n_dim = points.shape
-    d_arc_distances_d_points = np.zeros((n_points, n_points * n_dim))
 
-    # Break out the two-line calculation into subparts to help obtain
-    # derivatives easier
     diff_points = np.diff(points, axis=0)
-    sum_diffs = np.sum(diff_points**2, axis=1)
-    cartesian_distances = np.sqrt(sum_diffs)
-    cum_sum_distances = np.cumsum(cartesian_distances)
-    arc_distances = np.r_[0.0, cum_sum_distances]
-
-    # This can be sped up slightly through numpy vectorization, it's shown here in
-    # for-loop for clarity.
-    for i in range(1, n_points):
-        d_inner = 2 * points[i] - 2 * points[i - 1]
-        d_outer = 0.5 * (sum_diffs[i - 1]) ** (-0.5)
-        d_arc_distances_d_points[i, i * n_dim : i * n_dim + n_dim] = d_inner * d_outer
-
-        d_inner = 2 * points[i - 1] - 2 * points[i]
-        d_outer = 0.5 * (sum_diffs[i - 1]) ** (-0.5)
-        d_arc_distances_d_points[i, i * n_dim - n_dim : i * n_dim] = d_inner * d_outer
-
-        d_arc_distances_d_points[i:, i * n_dim - n_dim : i * n_dim] = np.sum(
-            d_arc_distances_d_points[i - 1 : i + 1, i * n_dim - n_dim : i * n_dim], axis=0
-        )
+    cartesian_distances = np.sqrt(np.sum(diff_points**2, axis=1))
+    arc_distances = np.r_[0.0, np.cumsum(cartesian_distances)]
+
+    # Segment i (ending at point i) contributes its unit vector to every
+    # distance from point i onwards, positively w.r.t. point i and negatively w.r.t.
+    # point i-1. Padding with zero segments at both ends covers the endpoints.
+    unit = np.zeros((n_points + 1, n_dim))
+    unit[1:-1] = diff_points / cartesian_distances[:, np.newaxis]
+    d_arc_distances_d_points = (
+        np.tri(n_points)[:, :, np.newaxis] * unit[:-1] - np.tri(n_points, k=-1)[:, :, np.newaxis] * unit[1:]
+    )
+    d_arc_distances_d_points = d_arc_distances_d_points.reshape((n_points, n_points * n_dim))
 
     return arc_distances, d_arc_distances_d_points
 
@@ -388,9 +372,10 @@ def sectionalInterp(xi, x, y):
 def interp_with_deriv(x, xp, yp):
     """linear interpolation and its derivative. To be precise, linear interpolation is not
     differentiable right at the control points, but in general it works well enough"""
-    # TODO: put in Fortran to speed up
-
     x, n = _checkIfFloat(x)
+    x = np.asarray(x)
+    xp = np.asarray(xp)
+    yp = np.asarray(yp)
 
     if np.any(np.diff(xp) < 0):
         raise TypeError("xp must be in ascending order")
@@ -398,31 +383,23 @@ def interp_with_deriv(x, xp, yp):
     # n = len(x)
     m = len(xp)
 
-    y = np.zeros(n)
-    dydx = np.zeros(n)
-    dydxp = np.zeros((n, m))
-    dydyp = np.zeros((n, m))
+    # first segment whose right end lies beyond x, linearly extrapolating off either end
+    j = np.minimum(np.searchsorted(xp[1:], x, side="right"), m - 2)
+    x1 = xp[j]
+    y1 = yp[j]
+    x2 = xp[j + 1]
+    y2 = yp[j + 1]
 
-    for i in range(n):
-        if x[i] < xp[0]:
-            j = 0  # linearly extrapolate
-        elif x[i] > xp[-1]:
-            j = m - 2
-        else:
-            for j in range(m - 1):
-                if xp[j + 1] > x[i]:
-                    break
-        x1 = xp[j]
-        y1 = yp[j]
-        x2 = xp[j + 1]
-        y2 = yp[j + 1]
+    y = y1 + (y2 - y1) * (x - x1) / (x2 - x1)
+    dydx = (y2 - y1) / (x2 - x1)
 
-        y[i] = y1 + (y2 - y1) * (x[i] - x1) / (x2 - x1)
-        dydx[i] = (y2 - y1) / (x2 - x1)
-        dydxp[i, j] = (y2 - y1) * (x[i] - x2) / (x2 - x1) ** 2
-        dydxp[i, j + 1] = -(y2 - y1) * (x[i] - x1) / (x2 - x1) ** 2
-        dydyp[i, j] = 1 - (x[i] - x1) / (x2 - x1)
-        dydyp[i, j + 1] = (x[i] - x1) / (x2 - x1)
+    rows = np.arange(n)
+    dydxp = np.zeros((n, m))
+    dydyp = np.zeros((n, m))
+    dydxp[rows, j] = (y2 - y1) * (x - x2) / (x2 - x1) ** 2
+    dydxp[rows, j + 1] = -(y2 - y1) * (x - x1) / (x2 - x1) ** 2
+    dydyp[rows, j] = 1 - (x - x1) / (x2 - x1)
+    dydyp[rows, j + 1] = (x - x1) / (x2 - x1)
 
     if n == 1:
         y = y[0]
@@ -680,6 +657,19 @@ def closest_node(nodemat, inode):
     return np.sqrt(np.sum((xyz - inode[np.newaxis, :]) ** 2, axis=1)).argmin()
 
 
+def memo_inputs(comp, key_names, inputs, build):
+    """Return build(inputs), reusing the result comp last built for key_names while those inputs are byte-identical.
+
+    Finite differencing and line searches re-run components with many inputs unchanged, so expensive
+    intermediates that only depend on a subset of them can be kept on the component between calls.
+    """
+    key = tuple(np.asarray(inputs[k]).tobytes() for k in key_names)
+    memo = comp.__dict__.setdefault("_memo", {})
+    if key_names not in memo or memo[key_names][0] != key:
+        memo[key_names] = key, build(inputs)
+    return memo[key_names][1]
+
+
 def nodal2sectional(x, axis=0):
     """Averages nodal data to be length-1 vector of sectional data
 
@@ -134,12 +134,8 @@ def fatigue(M_DEL, N_DEL, d, t, m=4, DC=80.0, eta=1.265, stress_factor=1.0, weld
     """
 
     # convert to mm
-    dvec = np.array(d) * 1e3
     tvec = np.array(t) * 1e3
-    r = 0.5 * dvec
-
-    nvec = len(d)
-    damage = np.zeros(nvec)
+    r = 0.5e3 * np.array(d)
 
     # initialize weld factor (added cubic spline around corner)
     if weld_factor:
@@ -152,22 +148,17 @@ def fatigue(M_DEL, N_DEL, d, t, m=4, DC=80.0, eta=1.265, stress_factor=1.0, weld
     else:
         weld = 1.0
 
-    # stress
-    I = np.pi * r**3 * tvec
-    sigma = M_DEL * r / I * stress_factor * 1e3  # convert to N/mm^2
+    # stress, M r / I with I = pi r^3 t
+    sigma = M_DEL / (np.pi * r**2 * tvec) * (stress_factor * 1e3)  # convert to N/mm^2
 
     # maximum allowed stress
     Smax = DC * weld / eta
 
-    # number of cycles to failure
-    Nf = (Smax / sigma) ** m
-
     # number of cycles for this load
     N1 = 2e6  # TODO: where does this come from?
-    N = N_DEL / N1
 
-    # damage
-    damage = N / Nf
+    # damage, N / Nf with cycles to failure Nf = (Smax / sigma)**m folded into one power
+    damage = (N_DEL / N1) * (sigma / Smax) ** m
 
     return damage
 
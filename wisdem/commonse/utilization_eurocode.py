@@ -81,35 +81,22 @@ def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma
 
     n = len(t)
     EU_utilization = np.zeros(n)
-    sigma_z_sh = np.zeros(n)
-    sigma_t_sh = np.zeros(n)
-    tau_zt_sh = np.zeros(n)
 
-    for i in range(n):
-        h = L_reinforced[i]
-
-        r1 = d[i] / 2.0 - t[i] / 2.0
-        r2 = d[i + 1] / 2.0 - t[i] / 2.0
-
-        sigma_z_shell = sigma_z[i]
-        sigma_t_shell = sigma_t[i]
-        tau_zt_shell = tau_zt[i]
+    # radii of the middle surface at the bottom and top of every section
+    r1 = d[:-1] / 2.0 - t / 2.0
+    r2 = d[1:] / 2.0 - t / 2.0
 
-        # TODO: the following is non-smooth, although in general its probably OK
-        # change to magnitudes and add safety factor
-        sigma_z_shell = gamma_f * abs(sigma_z_shell)
-        sigma_t_shell = gamma_f * abs(sigma_t_shell)
-        tau_zt_shell = gamma_f * abs(tau_zt_shell)
+    # TODO: the following is non-smooth, although in general its probably OK
+    # change to magnitudes and add safety factor
+    sigma_z_sh = gamma_f * np.abs(sigma_z)
+    sigma_t_sh = gamma_f * np.abs(sigma_t)
+    tau_zt_sh = gamma_f * np.abs(tau_zt)
 
+    for i in range(n):
         EU_utilization[i] = _shellBucklingOneSection(
-            h, r1, r2, t[i], gamma_b, sigma_z_shell, sigma_t_shell, tau_zt_shell, E[i], sigma_y[i]
+            L_reinforced[i], r1[i], r2[i], t[i], gamma_b, sigma_z_sh[i], sigma_t_sh[i], tau_zt_sh[i], E[i], sigma_y[i]
         )
 
-        # make them into vectors
-        sigma_z_sh[i] = sigma_z_shell
-        sigma_t_sh[i] = sigma_t_shell
-        tau_zt_sh[i] = tau_zt_shell
-
     return EU_utilization  # this is utilization must be <1
 
 
@@ -165,23 +165,24 @@ class AeroHydroLoads(om.ExplicitComponent):
 
     def compute(self, inputs, outputs):
         z = inputs["z"]
+        yaw = inputs["yaw"]
+        wind_z = inputs["windLoads_z"]
+        wave_z = inputs["waveLoads_z"]
         windLoads = (
             DirectionVector(inputs["windLoads_Px"], inputs["windLoads_Py"], inputs["windLoads_Pz"])
             .inertialToWind(inputs["windLoads_beta"])
-            .windToYaw(inputs["yaw"])
+            .windToYaw(yaw)
         )
         waveLoads = (
             DirectionVector(inputs["waveLoads_Px"], inputs["waveLoads_Py"], inputs["waveLoads_Pz"])
             .inertialToWind(inputs["waveLoads_beta"])
-            .windToYaw(inputs["yaw"])
+            .windToYaw(yaw)
         )
 
-        Px = np.interp(z, inputs["windLoads_z"], windLoads.x) + np.interp(z, inputs["waveLoads_z"], waveLoads.x)
-        Py = np.interp(z, inputs["windLoads_z"], windLoads.y) + np.interp(z, inputs["waveLoads_z"], waveLoads.y)
-        Pz = np.interp(z, inputs["windLoads_z"], windLoads.z) + np.interp(z, inputs["waveLoads_z"], waveLoads.z)
-        qdyn = np.interp(z, inputs["windLoads_z"], inputs["windLoads_qdyn"]) + np.interp(
-            z, inputs["waveLoads_z"], inputs["waveLoads_qdyn"]
-        )
+        Px = np.interp(z, wind_z, windLoads.x) + np.interp(z, wave_z, waveLoads.x)
+        Py = np.interp(z, wind_z, windLoads.y) + np.interp(z, wave_z, waveLoads.y)
+        Pz = np.interp(z, wind_z, windLoads.z) + np.interp(z, wave_z, waveLoads.z)
+        qdyn = np.interp(z, wind_z, inputs["windLoads_qdyn"]) + np.interp(z, wave_z, inputs["waveLoads_qdyn"])
 
         # The following are redundant, at one point we will consolidate them to something that works for both cylinder (not using vartrees) and jacket (still using vartrees)
         outputs["Px"] = Px
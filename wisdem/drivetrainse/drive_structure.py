@@ -327,8 +327,11 @@ class Hub_Rotor_LSS_Frame(om.ExplicitComponent):
         # myframe.write('myframe1.3dd') # Debugging
         displacements, forces, reactions, internalForces, mass3dd, modal = myframe.run()
 
+        # Nodal deflection magnitudes for all DLCs at once
+        deflection = np.sqrt(displacements.dx**2 + displacements.dy**2 + displacements.dz**2)
+
         # Loop over DLCs and append to outputs
-        rotor_gearbox_deflection = np.zeros(n_dlcs)
+        rotor_gearbox_deflection = deflection[:, itorq - 1]
         rotor_gearbox_angle = np.zeros(n_dlcs)
         outputs["F_mb1"] = np.zeros((3, n_dlcs))
         outputs["F_mb2"] = np.zeros((3, n_dlcs))
@@ -340,12 +343,7 @@ class Hub_Rotor_LSS_Frame(om.ExplicitComponent):
         outputs["lss_shear_stress"] = np.zeros((n - 1, n_dlcs))
         outputs["constr_lss_vonmises"] = np.zeros((n - 1, n_dlcs))
         for k in range(n_dlcs):
-            # Deflections and rotations at torq attachment
-            rotor_gearbox_deflection[k] = np.sqrt(
-                displacements.dx[k, itorq - 1] ** 2
-                + displacements.dy[k, itorq - 1] ** 2
-                + displacements.dz[k, itorq - 1] ** 2
-            )
+            # Rotations at torq attachment
             rotor_gearbox_angle[k] = (
                 displacements.dxrot[k, itorq - 1]
                 + displacements.dyrot[k, itorq - 1]
@@ -955,9 +953,10 @@ class Nose_Stator_Bedplate_Frame(om.ExplicitComponent):
         # ------------------------------------
 
         # Loop over DLCs and append to outputs
-        outputs["mb1_deflection"] = np.zeros(n_dlcs)
-        outputs["mb2_deflection"] = np.zeros(n_dlcs)
-        stator_deflection = np.zeros(n_dlcs)
+        deflection = np.sqrt(displacements.dx**2 + displacements.dy**2 + displacements.dz**2)
+        outputs["mb1_deflection"] = deflection[:, i1 - 1]
+        outputs["mb2_deflection"] = deflection[:, i2 - 1]
+        stator_deflection = deflection[:, istator - 1]
         outputs["mb1_angle"] = np.zeros(n_dlcs)
         outputs["mb2_angle"] = np.zeros(n_dlcs)
         stator_angle = np.zeros(n_dlcs)
@@ -968,18 +967,7 @@ class Nose_Stator_Bedplate_Frame(om.ExplicitComponent):
         outputs["bedplate_nose_bending_stress"] = np.zeros((n - 1, n_dlcs))
         outputs["constr_bedplate_vonmises"] = np.zeros((n - 1, n_dlcs))
         for k in range(n_dlcs):
-            # Deflections and rotations at bearings- how to sum up rotation angles?
-            outputs["mb1_deflection"][k] = np.sqrt(
-                displacements.dx[k, i1 - 1] ** 2 + displacements.dy[k, i1 - 1] ** 2 + displacements.dz[k, i1 - 1] ** 2
-            )
-            outputs["mb2_deflection"][k] = np.sqrt(
-                displacements.dx[k, i2 - 1] ** 2 + displacements.dy[k, i2 - 1] ** 2 + displacements.dz[k, i2 - 1] ** 2
-            )
-            stator_deflection[k] = np.sqrt(
-                displacements.dx[k, istator - 1] ** 2
-                + displacements.dy[k, istator - 1] ** 2
-                + displacements.dz[k, istator - 1] ** 2
-            )
+            # Rotations at bearings- how to sum up rotation angles?
             outputs["mb1_angle"][k] = (
                 displacements.dxrot[k, i1 - 1] + displacements.dyrot[k, i1 - 1] + displacements.dzrot[k, i1 - 1]
             )
@@ -1348,8 +1336,9 @@ class Bedplate_IBeam_Frame(om.ExplicitComponent):
         displacements, forces, reactions, internalForces, mass3dd, modal = myframe.run()
 
         # Loop over DLCs and append to outputs
-        outputs["mb1_deflection"] = np.zeros(n_dlcs)
-        outputs["mb2_deflection"] = np.zeros(n_dlcs)
+        deflection = np.sqrt(displacements.dx**2 + displacements.dy**2 + displacements.dz**2)
+        outputs["mb1_deflection"] = deflection[:, i1 - 1]
+        outputs["mb2_deflection"] = deflection[:, i2 - 1]
         outputs["mb1_angle"] = np.zeros(n_dlcs)
         outputs["mb2_angle"] = np.zeros(n_dlcs)
         outputs["base_F"] = np.zeros((3, n_dlcs))
@@ -1359,17 +1348,8 @@ class Bedplate_IBeam_Frame(om.ExplicitComponent):
         outputs["bedplate_bending_stress"] = np.zeros((2 * n - 2, n_dlcs))
         outputs["constr_bedplate_vonmises"] = np.zeros((2 * n - 2, n_dlcs))
         for k in range(n_dlcs):
-            # Deflections and rotations at bearings- how to sum up rotation angles?
-            outputs["mb1_deflection"][k] = np.sqrt(
-                displacements.dx[k, i1 - 1] ** 2 + displacements.dy[k, i1 - 1] ** 2 + displacements.dz[k, i1 - 1] ** 2
-            )
-            outputs["mb2_deflection"][k] = np.sqrt(
-                displacements.dx[k, i2 - 1] ** 2 + displacements.dy[k, i2 - 1] ** 2 + displacements.dz[k, i2 - 1] ** 2
-            )
-            bedplate_deflection = np.maximum(
-                np.sqrt(displacements.dx[k, n] ** 2 + displacements.dy[k, n] ** 2 + displacements.dz[k, n] ** 2),
-                np.sqrt(displacements.dx[k, -1] ** 2 + displacements.dy[k, -1] ** 2 + displacements.dz[k, -1] ** 2),
-            )
+            # Rotations at bearings- how to sum up rotation angles?
+            bedplate_deflection = np.maximum(deflection[k, n], deflection[k, -1])
             outputs["mb1_angle"][k] = (
                 displacements.dxrot[k, i1 - 1] + displacements.dyrot[k, i1 - 1] + displacements.dzrot[k, i1 - 1]
             )
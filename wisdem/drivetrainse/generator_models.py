@@ -771,7 +771,6 @@ class PMSG_Outer(GeneratorBase):
         m = int(discrete_inputs["m"])
         mu_0 = float(inputs["mu_0"])
         mu_r = float(inputs["mu_r"])
-        p = float(inputs["p"])
         phi = float(inputs["phi"])
         ratio_mw2pp = float(inputs["ratio_mw2pp"])
         resist_Cu = float(inputs["resist_Cu"])
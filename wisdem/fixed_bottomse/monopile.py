@@ -477,9 +477,7 @@ class MonopileFrame(om.ExplicitComponent):
             outputs["monopile_tower_G_full"] = G
             outputs["monopile_tower_sigma_y_full"] = sigma_y
             outputs["monopile_tower_bending_height"] = inputs['bending_height'] + inputs['tower_bending_height']
-            for ic in range(nLC):
-                qdyn = np.r_[inputs["qdyn"][:-1,ic], inputs["tower_qdyn"][:,ic]]
-                outputs["monopile_tower_qdyn"][:, ic] = qdyn
+            outputs["monopile_tower_qdyn"] = np.vstack((inputs["qdyn"][:-1, :], inputs["tower_qdyn"]))
 
 
         else:
@@ -519,6 +517,14 @@ class MonopileFrame(om.ExplicitComponent):
         gy = 0.0
         gz = -gravity
 
+        # distributed loads for all load cases: switch to local c.s.
+        if tower_flag:
+            Px_lc = np.vstack((inputs["Pz"], inputs["tower_Pz"]))
+            Py_lc = np.vstack((inputs["Py"], inputs["tower_Py"]))
+            Pz_lc = -np.vstack((inputs["Px"], inputs["tower_Px"]))
+        else:
+            Px_lc, Py_lc, Pz_lc = inputs["Pz"], inputs["Py"], -inputs["Px"]
+
         for k in range(nLC):
             load = pyframe3dd.StaticLoadCase(gx, gy, gz)
 
@@ -536,11 +542,6 @@ class MonopileFrame(om.ExplicitComponent):
                     np.array([rna_M[2]]).flatten(),
                 )
 
-                # distributed loads: switch to local c.s.
-                Px = np.r_[inputs["Pz"][:, k], inputs["tower_Pz"][:, k]]
-                Py = np.r_[inputs["Py"][:, k], inputs["tower_Py"][:, k]]
-                Pz = -1.0 * np.r_[inputs["Px"][:, k], inputs["tower_Px"][:, k]]
-
             else:
                 turb_F = inputs["turbine_F"][:, k]
                 turb_M = inputs["turbine_M"][:, k]
@@ -554,10 +555,8 @@ class MonopileFrame(om.ExplicitComponent):
                     np.array([turb_M[2]]).flatten(),
                 )
 
-                # distributed loads: switch to local c.s.
-                Px, Py, Pz = inputs["Pz"][:, k], inputs["Py"][:, k], -inputs["Px"][:, k]
-
             # trapezoidally distributed loads
+            Px, Py, Pz = Px_lc[:, k], Py_lc[:, k], Pz_lc[:, k]
             EL = element
             xx1 = xy1 = xz1 = np.zeros(EL.shape)
             xx2 = xy2 = xz2 = 0.99 * L  # subtract small number b.c. of precision
@@ -409,6 +409,7 @@ class PlatformTurbineSystem(om.ExplicitComponent):
         n_member = capacity.size
         outputs["member_variable_height"] = np.zeros(n_member)
         cg_variable_member = np.zeros((n_member, 3))
+        dxyz_member = np.zeros((n_member, 3))
         for k in range(n_member):
             if V_variable_member[k] == 0.0:
                 continue
@@ -416,7 +417,7 @@ class PlatformTurbineSystem(om.ExplicitComponent):
             xyz = inputs[f"member{k}:nodes_xyz"]
             inodes = np.where(xyz[:, 0] == NULL)[0][0]
             xyz = xyz[:inodes, :]
-            dxyz = xyz[-1, :] - xyz[0, :]
+            dxyz_member[k, :] = dxyz = xyz[-1, :] - xyz[0, :]
 
             spts = inputs[f"member{k}:variable_ballast_spts"]
             Vpts = inputs[f"member{k}:variable_ballast_Vpts"]
@@ -448,10 +449,8 @@ class PlatformTurbineSystem(om.ExplicitComponent):
             if V_variable_member[k] == 0.0:
                 continue
 
-            xyz = inputs[f"member{k}:nodes_xyz"]
-            inodes = np.where(xyz[:, 0] == NULL)[0][0]
-            xyz = xyz[:inodes, :]
-            vec_k = xyz[-1, :] - xyz[0, :]
+            # Member axis was already found in the loop above
+            vec_k = dxyz_member[k, :]
 
             ds = outputs["member_variable_height"][k]
 
@@ -950,13 +950,11 @@ class Compute_Blade_Outer_Shape_BEM(om.ExplicitComponent):
         if len(inputs["span_end"]) > 0:
             nd_span_orig = np.linspace(0.0, 1.0, self.n_span)
 
-            chord_orig = PchipInterpolator(inputs["s_default"], inputs["chord_yaml"])(nd_span_orig)
-            twist_orig = PchipInterpolator(inputs["s_default"], inputs["twist_yaml"])(nd_span_orig)
-            pitch_axis_orig = PchipInterpolator(inputs["s_default"], inputs["pitch_axis_yaml"])(nd_span_orig)
-            ref_axis_orig = np.zeros((self.n_span, 3))
-            ref_axis_orig[:, 0] = PchipInterpolator(inputs["s_default"], inputs["ref_axis_yaml"][:, 0])(nd_span_orig)
-            ref_axis_orig[:, 1] = PchipInterpolator(inputs["s_default"], inputs["ref_axis_yaml"][:, 1])(nd_span_orig)
-            ref_axis_orig[:, 2] = PchipInterpolator(inputs["s_default"], inputs["ref_axis_yaml"][:, 2])(nd_span_orig)
+            # One spline over all the spanwise quantities, stacked as columns [chord, twist, pitch_axis, ref_axis]
+            yaml_orig = np.c_[
+                inputs["chord_yaml"], inputs["twist_yaml"], inputs["pitch_axis_yaml"], inputs["ref_axis_yaml"]
+            ]
+            span_orig = PchipInterpolator(inputs["s_default"], yaml_orig)(nd_span_orig)
 
             outputs["s"] = copy.copy(nd_span_orig)
 
@@ -977,13 +975,11 @@ class Compute_Blade_Outer_Shape_BEM(om.ExplicitComponent):
                 idx_flap_end += 1
             outputs["s"][idx_flap_start] = flap_start
             outputs["s"][idx_flap_end] = flap_end
-            outputs["chord"] = PchipInterpolator(nd_span_orig, chord_orig)(outputs["s"])
-            outputs["twist"] = PchipInterpolator(nd_span_orig, twist_orig)(outputs["s"])
-            outputs["pitch_axis"] = PchipInterpolator(nd_span_orig, pitch_axis_orig)(outputs["s"])
-
-            outputs["ref_axis"][:, 0] = PchipInterpolator(nd_span_orig, ref_axis_orig[:, 0])(outputs["s"])
-            outputs["ref_axis"][:, 1] = PchipInterpolator(nd_span_orig, ref_axis_orig[:, 1])(outputs["s"])
-            outputs["ref_axis"][:, 2] = PchipInterpolator(nd_span_orig, ref_axis_orig[:, 2])(outputs["s"])
+            span_new = PchipInterpolator(nd_span_orig, span_orig)(outputs["s"])
+            outputs["chord"] = span_new[:, 0]
+            outputs["twist"] = span_new[:, 1]
+            outputs["pitch_axis"] = span_new[:, 2]
+            outputs["ref_axis"] = span_new[:, 3:]
         else:
             outputs["s"] = inputs["s_default"]
             outputs["chord"] = inputs["chord_yaml"]
@@ -1889,20 +1885,20 @@ class Compute_Blade_Internal_Structure_2D_FEM(om.ExplicitComponent):
                 offset = inputs["web_offset_y_pa_yaml"][j, i]
                 # Geometry checks on webs
                 if offset < ratio_Websmax * (-chord * p_le_i) or offset > ratio_Websmax * (chord * (1.0 - p_le_i)):
-                    offset_old = copy.copy(offset)
+                    offset_old = offset
                     if offset_old <= 0.0:
                         offset = ratio_Websmax * (-chord * p_le_i)
                     else:
                         offset = ratio_Websmax * (chord * (1.0 - p_le_i))
 
-                    outputs["web_offset_y_pa"][j, i] = copy.copy(offset)
+                    outputs["web_offset_y_pa"][j, i] = offset
                     layer_resize_warning = (
                         'WARNING: Web "%s" may be too large to fit within chord. "offset_x_pa" changed from %f to %f at R=%f (i=%d)'
                         % (web_name[j], offset_old, offset, inputs["s"][i], i)
                     )
                     # print(layer_resize_warning)
                 else:
-                    outputs["web_offset_y_pa"][j, i] = copy.copy(offset)
+                    outputs["web_offset_y_pa"][j, i] = offset
 
                 if discrete_inputs["definition_web"][j] == 1:
                     web_rotation[j, i] = -inputs["twist"][i]
@@ -1979,19 +1975,19 @@ class Compute_Blade_Internal_Structure_2D_FEM(om.ExplicitComponent):
                         offset + 0.5 * width > ratio_SCmax * chord * (1.0 - p_le_i)
                         or offset - 0.5 * width < -ratio_SCmax * chord * p_le_i
                     ):  # hitting TE or LE
-                        width_old = copy.copy(width)
+                        width_old = width
                         width = 2.0 * min([ratio_SCmax * (chord * p_le_i), ratio_SCmax * (chord * (1.0 - p_le_i))])
                         offset = 0.0
-                        outputs["layer_width"][j, i] = copy.copy(width)
-                        outputs["layer_offset_y_pa"][j, i] = copy.copy(offset)
+                        outputs["layer_width"][j, i] = width
+                        outputs["layer_offset_y_pa"][j, i] = offset
                         layer_resize_warning = (
                             'WARNING: Layer "%s" may be too large to fit within chord. "offset_y_pa" changed from %f to 0.0 and "width" changed from %f to %f at s=%f (i=%d)'
                             % (layer_name[j], offset, width_old, width, inputs["s"][i], i)
                         )
                         # print(layer_resize_warning)
                     else:
-                        outputs["layer_width"][j, i] = copy.copy(width)
-                        outputs["layer_offset_y_pa"][j, i] = copy.copy(offset)
+                        outputs["layer_width"][j, i] = width
+                        outputs["layer_offset_y_pa"][j, i] = offset
 
                     layer_start_nd[j, i] = midpoint - width / arc_L_i / 2.0
                     layer_end_nd[j, i] = midpoint + width / arc_L_i / 2.0
@@ -2000,7 +1996,7 @@ class Compute_Blade_Internal_Structure_2D_FEM(om.ExplicitComponent):
                     midpoint = 1.0
                     inputs["layer_midpoint_nd"][j, i] = midpoint
                     width = inputs["layer_width_yaml"][j, i]
-                    outputs["layer_width"][j, i] = copy.copy(width)
+                    outputs["layer_width"][j, i] = width
                     layer_start_nd[j, i] = midpoint - width / arc_L_i / 2.0
                     layer_end_nd[j, i] = width / arc_L_i / 2.0
 
@@ -2018,7 +2014,7 @@ class Compute_Blade_Internal_Structure_2D_FEM(om.ExplicitComponent):
                     midpoint = LE_loc
                     inputs["layer_midpoint_nd"][j, i] = midpoint
                     width = inputs["layer_width_yaml"][j, i]
-                    outputs["layer_width"][j, i] = copy.copy(width)
+                    outputs["layer_width"][j, i] = width
                     layer_start_nd[j, i] = midpoint - width / arc_L_i / 2.0
                     layer_end_nd[j, i] = midpoint + width / arc_L_i / 2.0
                     # # Geometry check to prevent overlap between SC and LE reinf
@@ -2051,12 +2047,12 @@ class Compute_Blade_Internal_Structure_2D_FEM(om.ExplicitComponent):
                     layer_end_nd[j, i] = layer_start_nd[int(discrete_inputs["index_layer_end"][j]), i]
                 elif discrete_inputs["definition_layer"][j] == 7:  # Start nd and width
                     width = inputs["layer_width_yaml"][j, i]
-                    outputs["layer_width"][j, i] = copy.copy(width)
+                    outputs["layer_width"][j, i] = width
                     layer_start_nd[j, i] = inputs["layer_start_nd_yaml"][j, i]
                     layer_end_nd[j, i] = layer_start_nd[j, i] + width / arc_L_i
                 elif discrete_inputs["definition_layer"][j] == 8:  # End nd and width
                     width = inputs["layer_width_yaml"][j, i]
-                    outputs["layer_width"][j, i] = copy.copy(width)
+                    outputs["layer_width"][j, i] = width
                     layer_end_nd[j, i] = inputs["layer_end_nd_yaml"][j, i]
                     layer_start_nd[j, i] = layer_end_nd[j, i] - width / arc_L_i
                 elif discrete_inputs["definition_layer"][j] == 9:  # Start and end nd positions
@@ -2230,10 +2226,11 @@ class Compute_Grid(om.ExplicitComponent):
         )
 
         # Declare all partial derivatives.
-        self.declare_partials("height", "ref_axis")
+        # Height and foundation height only see the z-coordinates of the end points with constant unit slopes
+        self.declare_partials("height", "ref_axis", rows=[0, 0], cols=[2, 3 * n_height - 1], val=[-1.0, 1.0])
         self.declare_partials("length", "ref_axis")
         self.declare_partials("s", "ref_axis")
-        self.declare_partials("foundation_height", "ref_axis")
+        self.declare_partials("foundation_height", "ref_axis", rows=[0], cols=[2], val=1.0)
 
     def compute(self, inputs, outputs):
         # Compute tower height and tower length (a straight tower will be high as long)
@@ -2246,12 +2243,6 @@ class Compute_Grid(om.ExplicitComponent):
             outputs["s"] = myarc / myarc[-1]
 
     def compute_partials(self, inputs, partials):
-        n_height = self.options["n_height"]
-        partials["height", "ref_axis"] = np.zeros((1, n_height * 3))
-        partials["height", "ref_axis"][0, -1] = 1.0
-        partials["height", "ref_axis"][0, 2] = -1.0
-        partials["foundation_height", "ref_axis"] = np.zeros((1, n_height * 3))
-        partials["foundation_height", "ref_axis"][0, 2] = 1.0
         arc_distances, d_arc_distances_d_points = arc_length_deriv(inputs["ref_axis"])
 
         # The length is based on only the final point in the arc,
@@ -66,9 +66,25 @@ class PlantFinance(om.ExplicitComponent):
         Profitability adjusted LCOE
     """
 
+    # Only the LCOE partials are computed analytically, the discrete turbine count has none
+    _lcoe_wrt = (
+        "tcc_per_kW",
+        "offset_tcc_per_kW",
+        "bos_per_kW",
+        "opex_per_kW",
+        "fixed_charge_rate",
+        "wake_loss_factor",
+        "turbine_aep",
+        "plant_aep_in",
+        "machine_rating",
+    )
+
     def initialize(self):
         self.options.declare("verbosity", default=False)
 
+        # Filled in place by compute, since the partials share most of its intermediate terms
+        self.J = dict.fromkeys([("lcoe", wrt) for wrt in self._lcoe_wrt], 0.0)
+
     def setup(self):
         # Inputs
         self.add_input("machine_rating", val=0.0, units="kW")
@@ -146,7 +162,7 @@ class PlantFinance(om.ExplicitComponent):
             desc="Profitability adjusted PLCOE is the product of a benchmark price and CBR, which is equal to LCOE divided by value factor. A lower PLCOE is more competitive. PLCOE ≤ benchmark price for economic viability.",
         )
 
-        self.declare_partials("*", "*")
+        self.declare_partials("lcoe", list(self._lcoe_wrt))
 
     def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
         # Unpack parameters
@@ -216,10 +232,6 @@ class PlantFinance(om.ExplicitComponent):
         icc = (c_turbine + c_bos_turbine) / t_rating  # $/kW, changed per COE report
         c_opex = (c_opex_turbine) / t_rating  # $/kW, changed per COE report
 
-        dicc_dtrating = -icc / t_rating
-        dcopex_dtrating = -c_opex / t_rating
-        dicc_dcturb = dicc_dcbos = dcopex_dcopex = 1.0 / t_rating
-
         C = icc * fcr + c_opex
         E = nec
         V = nec * electricity_price + reserve_margin_price * capacity_credit
@@ -250,19 +262,22 @@ class PlantFinance(om.ExplicitComponent):
         outputs["pm"] = pm
         outputs["plcoe"] = plcoe
 
-        self.J = {}
-        self.J["lcoe", "tcc_per_kW"] = dicc_dcturb * fcr / nec
-        self.J["lcoe", "turbine_number"] = -dnec_dnturb * lcoe / nec
-        self.J["lcoe", "bos_per_kW"] = dicc_dcbos * fcr / nec
-        self.J["lcoe", "opex_per_kW"] = dcopex_dcopex / nec
-        self.J["lcoe", "fixed_charge_rate"] = icc / nec
-        self.J["lcoe", "wake_loss_factor"] = -dnec_dwlf * lcoe / nec
-        self.J["lcoe", "turbine_aep"] = -dnec_dtaep * lcoe / nec
-        self.J["lcoe", "plant_aep_in"] = -dnec_dpaep * lcoe / nec
-        self.J["lcoe", "machine_rating"] = (dicc_dtrating * fcr + dcopex_dtrating) / nec - dnec_dtrating * lcoe / nec
+        # Partials share most of the intermediate terms, so store them here for compute_partials
+        inv_nec = 1.0 / nec
+        dlcoe_dnec = -lcoe * inv_nec
+        self.J["lcoe", "tcc_per_kW"] = fcr * inv_nec
+        self.J["lcoe", "offset_tcc_per_kW"] = fcr * inv_nec
+        self.J["lcoe", "bos_per_kW"] = fcr * inv_nec
+        self.J["lcoe", "opex_per_kW"] = inv_nec
+        self.J["lcoe", "fixed_charge_rate"] = icc * inv_nec
+        self.J["lcoe", "wake_loss_factor"] = dnec_dwlf * dlcoe_dnec
+        self.J["lcoe", "turbine_aep"] = dnec_dtaep * dlcoe_dnec
+        self.J["lcoe", "plant_aep_in"] = dnec_dpaep * dlcoe_dnec
+        self.J["lcoe", "machine_rating"] = dnec_dtrating * dlcoe_dnec
 
     def compute_partials(self, inputs, J, discrete_inputs):
-        J = self.J
+        for key, val in self.J.items():
+            J[key] = val
 
 
 # OpenMDAO group to execute the plant finance SE model as a standalone
@@ -365,25 +365,56 @@ NodeMasses = namedtuple(
 Modes = namedtuple("Modes", ["freq", "xmpf", "ympf", "zmpf", "node", "xdsp", "ydsp", "zdsp", "xrot", "yrot", "zrot"])
 
 
+_libpyframe3dd = None
+
+
+def _load_library():
+    """Load the Frame3DD shared library and declare its signature, once per process"""
+    global _libpyframe3dd
+    if _libpyframe3dd is not None:
+        return _libpyframe3dd
+
+    mydir = os.path.dirname(os.path.realpath(__file__))  # get path to this file
+    try:
+        lib = np.ctypeslib.load_library(libname, mydir)
+    except:
+        mydir = os.path.abspath(os.path.dirname(mydir))
+        lib = np.ctypeslib.load_library(libname, mydir)
+
+    lib.run.argtypes = [
+        POINTER(C_Nodes),
+        POINTER(C_Reactions),
+        POINTER(C_Elements),
+        POINTER(C_OtherElementData),
+        c_int,
+        POINTER(C_LoadCase),
+        POINTER(C_DynamicData),
+        POINTER(C_ExtraInertia),
+        POINTER(C_ExtraMass),
+        POINTER(C_Condensation),
+        POINTER(C_Displacements),
+        POINTER(C_Forces),
+        POINTER(C_ReactionForces),
+        POINTER(POINTER(C_InternalForces)),
+        POINTER(C_MassResults),
+        POINTER(C_ModalResults),
+    ]
+
+    lib.run.restype = c_int
+
+    _libpyframe3dd = lib
+    return lib
+
+
 class Frame(object):
     def __init__(self, nodes, reactions, elements, options):
         """docstring"""
 
-        self.nodes = nodes
         self.elements = elements
         self.options = options
 
         # convert to C int size (not longs) and copy to prevent releasing (b/c address space is shared by c)
 
-        # nodes
-        self.nnode = np.array(nodes.node).astype(np.int32).flatten()
-        self.nx = np.copy(nodes.x).flatten()
-        self.ny = np.copy(nodes.y).flatten()
-        self.nz = np.copy(nodes.z).flatten()
-        self.nr = np.copy(nodes.r).flatten()
-
-        self.set_reactions(reactions)
-
         # elements
         self.eelement = np.array(elements.element).astype(np.int32).flatten()
         self.eN1 = np.array(elements.N1).astype(np.int32).flatten()
@@ -399,16 +430,12 @@ class Frame(object):
         self.eroll = np.copy(elements.roll).flatten()
         self.edensity = np.copy(elements.density).flatten()
 
-        # Compute length of elements
-        self.eL = np.sqrt(
-            (self.nx[self.eN2 - 1] - self.nx[self.eN1 - 1]) ** 2.0
-            + (self.ny[self.eN2 - 1] - self.ny[self.eN1 - 1]) ** 2.0
-            + (self.nz[self.eN2 - 1] - self.nz[self.eN1 - 1]) ** 2.0
-        )
+        # nodes (needs the element connectivity for the element lengths)
+        self.set_nodes(nodes)
 
-        # create c objects
-        self.c_nodes = C_Nodes(len(self.nnode), ip(self.nnode), dp(self.nx), dp(self.ny), dp(self.nz), dp(self.nr))
+        self.set_reactions(reactions)
 
+        # create c objects
         self.c_elements = C_Elements(
             len(self.eelement),
             ip(self.eelement),
@@ -448,33 +475,25 @@ class Frame(object):
         self.changeCondensationData(0, i, d, d, d, d, d, d, i)
 
         # load c module
-        mydir = os.path.dirname(os.path.realpath(__file__))  # get path to this file
-        try:
-            self._pyframe3dd = np.ctypeslib.load_library(libname, mydir)
-        except:
-            mydir = os.path.abspath(os.path.dirname(mydir))
-            self._pyframe3dd = np.ctypeslib.load_library(libname, mydir)
-
-        self._pyframe3dd.run.argtypes = [
-            POINTER(C_Nodes),
-            POINTER(C_Reactions),
-            POINTER(C_Elements),
-            POINTER(C_OtherElementData),
-            c_int,
-            POINTER(C_LoadCase),
-            POINTER(C_DynamicData),
-            POINTER(C_ExtraInertia),
-            POINTER(C_ExtraMass),
-            POINTER(C_Condensation),
-            POINTER(C_Displacements),
-            POINTER(C_Forces),
-            POINTER(C_ReactionForces),
-            POINTER(POINTER(C_InternalForces)),
-            POINTER(C_MassResults),
-            POINTER(C_ModalResults),
-        ]
-
-        self._pyframe3dd.run.restype = c_int
+        self._pyframe3dd = _load_library()
+
+    def set_nodes(self, nodes):
+        # nodes, can be changed between runs without rebuilding the frame
+        self.nodes = nodes
+        self.nnode = np.array(nodes.node).astype(np.int32).flatten()
+        self.nx = np.copy(nodes.x).flatten()
+        self.ny = np.copy(nodes.y).flatten()
+        self.nz = np.copy(nodes.z).flatten()
+        self.nr = np.copy(nodes.r).flatten()
+
+        # Compute length of elements
+        self.eL = np.sqrt(
+            (self.nx[self.eN2 - 1] - self.nx[self.eN1 - 1]) ** 2.0
+            + (self.ny[self.eN2 - 1] - self.ny[self.eN1 - 1]) ** 2.0
+            + (self.nz[self.eN2 - 1] - self.nz[self.eN1 - 1]) ** 2.0
+        )
+
+        self.c_nodes = C_Nodes(len(self.nnode), ip(self.nnode), dp(self.nx), dp(self.ny), dp(self.nz), dp(self.nr))
 
     def set_reactions(self, reactions):
         # reactions
@@ -878,22 +897,13 @@ class Frame(object):
 
         c_modalResults = (C_ModalResults * nM)()
 
-        freq = [0] * nM
-        xmpf = [0] * nM
-        ympf = [0] * nM
-        zmpf = [0] * nM
-
+        # frequencies and participation factors are written straight into the output arrays
         for i in range(nM):
-            freq[i] = c_double()
-            xmpf[i] = c_double()
-            ympf[i] = c_double()
-            zmpf[i] = c_double()
-
             c_modalResults[i] = C_ModalResults(
-                pointer(freq[i]),
-                pointer(xmpf[i]),
-                pointer(ympf[i]),
-                pointer(zmpf[i]),
+                dp(modalout.freq[i:]),
+                dp(modalout.xmpf[i:]),
+                dp(modalout.ympf[i:]),
+                dp(modalout.zmpf[i:]),
                 ip(modalout.node[i, :]),
                 dp(modalout.xdsp[i, :]),
                 dp(modalout.ydsp[i, :]),
@@ -939,13 +949,6 @@ class Frame(object):
             mout.zinrta,
         )
 
-        # put modal results back in
-        for i in range(nM):
-            modalout.freq[i] = freq[i].value
-            modalout.xmpf[i] = xmpf[i].value
-            modalout.ympf[i] = ympf[i].value
-            modalout.zmpf[i] = zmpf[i].value
-
         nantest1 = np.isnan(np.c_[fout.Nx, fout.Vy, fout.Vz, fout.Txx, fout.Myy, fout.Mzz])
         nantest2 = np.isnan(modalout.freq)
         if not nanokay and (np.any(nantest1) or np.any(nantest2)):
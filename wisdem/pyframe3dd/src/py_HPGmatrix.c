@@ -811,7 +811,7 @@ void coord_xfrm ( float **Rr, float **R, float theta, int n )
 void xtAx(double **A, double **X, double **C, int N, int J)
 {
 
-	double  **AX;
+	double  **AX, a;
 	int     i,j,k;
 
 	AX = dmatrix(1,N,1,J);
@@ -820,17 +820,16 @@ void xtAx(double **A, double **X, double **C, int N, int J)
 	for (i=1; i<=N; i++)    for (j=1; j<=J; j++)    AX[i][j] = 0.0;
 
 	for (i=1; i<=N; i++) {	  /*  use upper triangle of A */
-		for (j=1; j<=J; j++) {
-			for (k=1; k<=N; k++) {
-				if ( i <= k )   AX[i][j] += A[i][k] * X[k][j];
-				else	    AX[i][j] += A[k][i] * X[k][j];
-			}
+		for (k=1; k<=N; k++) {	  /*  walk rows of X, not columns */
+			a = ( i <= k ) ? A[i][k] : A[k][i];
+			if ( a == 0.0 )	continue;
+			for (j=1; j<=J; j++)	AX[i][j] += a * X[k][j];
 		}
 	}
 
-	for (i=1; i<=J; i++)
-		for (j=1; j<=J; j++)
-			for (k=1; k<=N; k++)
+	for (k=1; k<=N; k++)
+		for (i=1; i<=J; i++)
+			for (j=1; j<=J; j++)
 				C[i][j] += X[k][i] * AX[k][j];
 
 	for (i=1; i<=J; i++)	    /*  make  C  symmetric */
@@ -3319,8 +3319,6 @@ class BladeCost(om.ExplicitComponent):
         s = inputs["s"]
         blade_length = inputs["blade_length"]
         chord = inputs["chord"]
-        blade_length = inputs["blade_length"]
-        s = inputs["s"]
         layer_start_nd = inputs["layer_start_nd"]
         layer_end_nd = inputs["layer_end_nd"]
         web_start_nd = inputs["web_start_nd"]
@@ -53,8 +53,7 @@ def distfunc(dinp, ival=1):
         if ival == 2:
             dy[n0 : n1 + 1] = sinhdist(delta1, delta2, _len, n0, n1)
 
-        for j in range(n0 + 1, n1 + 1):
-            fdist[j] = fdist[n0] + dy[j]
+        fdist[n0 + 1 : n1 + 1] = fdist[n0] + dy[n0 + 1 : n1 + 1]
 
         s0 = s1
         d0 = d1
@@ -70,6 +69,7 @@ def tanhdist(delta1=None, delta2=None, _len=None, i1=None, i2=None):
     delta2 = delta2 / _len
     ni = i2 - i1
     fdist = np.zeros(ni + 1)
+    xi = np.arange(ni + 1) / ni
     if delta1 <= 0.0 and 1.0 / delta2 < ni:
         delta1 = 1 / (ni**2 * delta2 * 1.02)
     else:
@@ -80,30 +80,24 @@ def tanhdist(delta1=None, delta2=None, _len=None, i1=None, i2=None):
         b = 1.0 / (ni * np.sqrt(delta1 * delta2))
         if b >= 1.0:
             delta = transsinh(b)
-            for i in range(ni + 1):
-                ftmp = 0.5 * (1 + np.tanh(delta * (i / ni - 0.5)) / np.tanh(0.5 * delta))
-                fdist[i] = ftmp / (a + (1 - a) * ftmp)
+            ftmp = 0.5 * (1 + np.tanh(delta * (xi - 0.5)) / np.tanh(0.5 * delta))
         else:
             delta = transtanh(b)
-            for i in range(ni + 1):
-                ftmp = 0.5 * (1 + np.sinh(delta * (i / ni - 0.5)) / np.sinh(0.5 * delta))
-                fdist[i] = ftmp / (a + (1 - a) * ftmp)
+            ftmp = 0.5 * (1 + np.sinh(delta * (xi - 0.5)) / np.sinh(0.5 * delta))
+        fdist[:] = ftmp / (a + (1 - a) * ftmp)
     else:
         if delta1 > 0.0:
             b = 1.0 / (ni * delta1)
             delta = transsinh(b)
-            for i in range(ni + 1):
-                fdist[i] = 1.0 + np.tanh(0.5 * delta * (i / ni - 1.0)) / np.tanh(0.5 * delta)
+            fdist[:] = 1.0 + np.tanh(0.5 * delta * (xi - 1.0)) / np.tanh(0.5 * delta)
         else:
             if delta2 > 0.0:
                 b = 1.0 / (ni * delta2)
                 delta = transsinh(b)
-                for i in range(ni + 1):
-                    fdist[i] = np.tanh(0.5 * delta * i / ni) / np.tanh(0.5 * delta)
+                fdist[:] = np.tanh(0.5 * delta * xi) / np.tanh(0.5 * delta)
             else:
                 print("Error from tandist, no cell hight is given")
-    for i in range(ni + 1):
-        fdist[i] = fdist[i] * _len
+    fdist *= _len
     return fdist
 
 
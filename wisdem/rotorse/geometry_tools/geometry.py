@@ -45,7 +45,7 @@ class Curve(object):
         """compute the unit direction vectors along the curve"""
 
         t1 = np.gradient(self.points[:, :])[0]
-        self.dp = np.array([t1[i, :] / np.linalg.norm(t1[i, :]) for i in range(np.shape(t1)[0])])
+        self.dp = t1 / np.linalg.norm(t1, axis=1)[:, np.newaxis]
 
     def _build_splines(self):
         self._splines = []
@@ -182,6 +182,11 @@ class ParametrizeBladeStruct(om.ExplicitComponent):
 
     def compute(self, inputs, outputs):
         layer_name = self.options["rotorse_options"]["layer_name"]
+        s = inputs["s"]
+
+        # Start from the original thickness of every layer along the whole span,
+        # then overwrite only the rows of the layers being optimized
+        layer_thickness = inputs["layer_thickness_original"].copy()
 
         spar_cap_ss_name = self.options["rotorse_options"]["spar_cap_ss"]
         spar_cap_ps_name = self.options["rotorse_options"]["spar_cap_ps"]
@@ -189,22 +194,22 @@ class ParametrizeBladeStruct(om.ExplicitComponent):
         ss_before_ps = False
         opt_ss = self.opt_options["design_variables"]["blade"]["structure"]["spar_cap_ss"]["flag"]
         opt_ps = self.opt_options["design_variables"]["blade"]["structure"]["spar_cap_ss"]["flag"]
-        for i in range(self.n_layers):
-            if layer_name[i] == spar_cap_ss_name and opt_ss and opt_ps:
-                opt_m_interp = PchipInterpolator(inputs["s_opt_spar_cap_ss"], inputs["spar_cap_ss_opt"])(inputs["s"])
-                ss_before_ps = True
-            elif layer_name[i] == spar_cap_ps_name and opt_ss and opt_ps:
-                if (
-                    self.opt_options["design_variables"]["blade"]["structure"]["spar_cap_ps"]["equal_to_suction"]
-                    == False
-                ) or ss_before_ps == False:
-                    opt_m_interp = PchipInterpolator(inputs["s_opt_spar_cap_ps"], inputs["spar_cap_ps_opt"])(inputs["s"])
-                else:
-                    opt_m_interp = PchipInterpolator(inputs["s_opt_spar_cap_ss"], inputs["spar_cap_ss_opt"])(inputs["s"])
-            else:
-                opt_m_interp = inputs["layer_thickness_original"][i, :]
-
-            outputs["layer_thickness_param"][i, :] = opt_m_interp
+        if opt_ss and opt_ps:
+            spar_cap_ss_interp = PchipInterpolator(inputs["s_opt_spar_cap_ss"], inputs["spar_cap_ss_opt"])(s)
+            for i in range(self.n_layers):
+                if layer_name[i] == spar_cap_ss_name:
+                    layer_thickness[i, :] = spar_cap_ss_interp
+                    ss_before_ps = True
+                elif layer_name[i] == spar_cap_ps_name:
+                    if (
+                        self.opt_options["design_variables"]["blade"]["structure"]["spar_cap_ps"]["equal_to_suction"]
+                        == False
+                    ) or ss_before_ps == False:
+                        layer_thickness[i, :] = PchipInterpolator(
+                            inputs["s_opt_spar_cap_ps"], inputs["spar_cap_ps_opt"]
+                        )(s)
+                    else:
+                        layer_thickness[i, :] = spar_cap_ss_interp
 
         te_ss_name = self.options["rotorse_options"]["te_ss"]
         te_ps_name = self.options["rotorse_options"]["te_ps"]
@@ -212,21 +217,21 @@ class ParametrizeBladeStruct(om.ExplicitComponent):
         ss_before_ps = False
         opt_ss = self.opt_options["design_variables"]["blade"]["structure"]["te_ss"]["flag"]
         opt_ps = self.opt_options["design_variables"]["blade"]["structure"]["te_ss"]["flag"]
-        for i in range(self.n_layers):
-            if layer_name[i] == te_ss_name and opt_ss and opt_ps:
-                opt_m_interp = PchipInterpolator(inputs["s_opt_te_ss"], inputs["te_ss_opt"])(inputs["s"])
-                ss_before_ps = True
-            elif layer_name[i] == te_ps_name and opt_ss and opt_ps:
-                if (
-                    self.opt_options["design_variables"]["blade"]["structure"]["te_ps"]["equal_to_suction"] == False
-                ) or ss_before_ps == False:
-                    opt_m_interp = PchipInterpolator(inputs["s_opt_te_ps"], inputs["te_ps_opt"])(inputs["s"])
-                else:
-                    opt_m_interp = PchipInterpolator(inputs["s_opt_te_ss"], inputs["te_ss_opt"])(inputs["s"])
-            else:
-                opt_m_interp = outputs["layer_thickness_param"][i, :]
-
-            outputs["layer_thickness_param"][i, :] = opt_m_interp
+        if opt_ss and opt_ps:
+            te_ss_interp = PchipInterpolator(inputs["s_opt_te_ss"], inputs["te_ss_opt"])(s)
+            for i in range(self.n_layers):
+                if layer_name[i] == te_ss_name:
+                    layer_thickness[i, :] = te_ss_interp
+                    ss_before_ps = True
+                elif layer_name[i] == te_ps_name:
+                    if (
+                        self.opt_options["design_variables"]["blade"]["structure"]["te_ps"]["equal_to_suction"] == False
+                    ) or ss_before_ps == False:
+                        layer_thickness[i, :] = PchipInterpolator(inputs["s_opt_te_ps"], inputs["te_ps_opt"])(s)
+                    else:
+                        layer_thickness[i, :] = te_ss_interp
+
+        outputs["layer_thickness_param"] = layer_thickness
 
 
 class ComputeReynolds(om.ExplicitComponent):
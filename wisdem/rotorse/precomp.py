@@ -12,6 +12,7 @@ from __future__ import print_function
 import os
 import copy
 import math
+from operator import attrgetter
 
 import numpy as np
 
@@ -20,6 +21,12 @@ import numpy as np
 # from external._precomp import precomp as _precomp
 from wisdem.rotorse._precomp import precomp as _precomp
 
+# placeholder web arrays for sections without webs
+_NO_WEBS = np.zeros(1)
+
+# material properties in the order expected by _precomp.properties
+_MAT_PROPS = attrgetter("E1", "E2", "G12", "nu12", "rho")
+
 
 def web_loc(r, chord, le, ib_idx, ob_idx, ib_webc, ob_webc):
     n = len(r)
@@ -39,6 +46,105 @@ def web_loc(r, chord, le, ib_idx, ob_idx, ib_webc, ob_webc):
     return loc
 
 
+def sector_midpoints(cs_list, *sector_idx_arrays):
+    """Normalized chordwise midpoint of the selected sector of each section
+
+    Parameters
+    ----------
+    cs_list : list(:class:`CompositeSection`)
+        composite sections along the span
+    sector_idx_arrays : list(int or None)
+        index of the sector of interest at each section, None if there is none.
+        Several index arrays can be given for the same sections.
+
+    Returns
+    -------
+    valid : ndarray(bool), shape(len(sector_idx_arrays), n)
+        True where a sector was selected
+    xmid : ndarray, shape(len(sector_idx_arrays), n)
+        midpoint of the sector (zero where no sector was selected)
+
+    """
+    n = len(cs_list)
+    valid = np.array([[idx is not None for idx in sector_idx] for sector_idx in sector_idx_arrays], dtype=bool)
+    idx = np.array([[0 if k is None else k for k in sector_idx] for sector_idx in sector_idx_arrays], dtype=int)
+    idx = idx.reshape(valid.shape)
+
+    # pad the ragged sector boundaries into a single array
+    nloc = max([2] + [len(cs.loc) for cs in cs_list])
+    loc = np.zeros((n, nloc))
+    for i, cs in enumerate(cs_list):
+        loc[i, : len(cs.loc)] = cs.loc
+
+    rows = np.arange(n)
+    xmid = np.where(valid, 0.5 * (loc[rows, idx] + loc[rows, np.minimum(idx + 1, nloc - 1)]), 0.0)
+
+    return valid, xmid
+
+
+def tw_rate(r, theta):
+    """Twist rate along the span, same stencil as PreComp's tw_rate
+
+    Parameters
+    ----------
+    r : ndarray
+        radial positions of the stations
+    theta : ndarray
+        twist at each station
+
+    Returns
+    -------
+    th_prime : ndarray
+        rate of change of twist with respect to r
+
+    """
+    th_prime = np.empty(len(r))
+    h = np.diff(r)
+    dtheta = np.diff(theta)
+
+    # three-point difference in the interior, one-sided at the ends
+    h1 = h[:-1]
+    h2 = h[1:]
+    th_prime[1:-1] = (h1 * dtheta[1:] + h2 * dtheta[:-1]) / (2.0 * h1 * h2)
+    th_prime[0] = dtheta[0] / h[0]
+    th_prime[-1] = dtheta[-1] / h[-1]
+
+    return th_prime
+
+
+def interp_rows(xq, xp, fp):
+    """Row-wise linear interpolation on a shared grid, same as
+    ``np.interp(xq[i], xp, fp[i, :])`` for every row i
+
+    Parameters
+    ----------
+    xq : ndarray (n)
+        query point of each row
+    xp : ndarray (m)
+        increasing grid shared by all rows
+    fp : ndarray (n, m)
+        values on the grid
+
+    Returns
+    -------
+    f : ndarray (n)
+        interpolated values
+
+    """
+    m = len(xp)
+    rows = np.arange(len(xq))
+    j = np.clip(np.searchsorted(xp, xq, side="right") - 1, 0, m - 2)
+
+    slope = (fp[rows, j + 1] - fp[rows, j]) / (xp[j + 1] - xp[j])
+    f = slope * (xq - xp[j]) + fp[rows, j]
+
+    # clamp outside of the grid like np.interp
+    f = np.where(xq <= xp[0], fp[:, 0], f)
+    f = np.where(xq >= xp[-1], fp[:, -1], f)
+
+    return f
+
+
 class PreComp:
     def __init__(
         self,
@@ -104,7 +210,7 @@ class PreComp:
         self.sector_idx_strain_te_ss = sector_idx_strain_te_ss
 
         # twist rate
-        self.th_prime = _precomp.tw_rate(self.r, self.theta)
+        self.th_prime = tw_rate(self.r, self.theta)
 
     def sectionProperties(self):
         """see meth:`SectionStrucInterface.sectionProperties`"""
@@ -112,37 +218,8 @@ class PreComp:
         # radial discretization
         nsec = len(self.r)
 
-        # initialize variables
-        beam_z = self.r
-        beam_EA = np.zeros(nsec)
-        beam_EIxx = np.zeros(nsec)
-        beam_EIyy = np.zeros(nsec)
-        beam_EIxy = np.zeros(nsec)
-        beam_GJ = np.zeros(nsec)
-        beam_rhoA = np.zeros(nsec)
-        beam_A = np.zeros(nsec)
-        beam_rhoJ = np.zeros(nsec)
-        beam_Tw_iner = np.zeros(nsec)
-
-        beam_flap_iner = np.zeros(nsec)
-        beam_edge_iner = np.zeros(nsec)
-
-        beam_x_sc = np.zeros(nsec)
-        beam_y_sc = np.zeros(nsec)
-        beam_x_tc = np.zeros(nsec)
-        beam_y_tc = np.zeros(nsec)
-        beam_x_cg = np.zeros(nsec)
-        beam_y_cg = np.zeros(nsec)
-
-        # distance to elastic center from point about which structural properties are computed
-        # using airfoil coordinate system
-        beam_x_ec = np.zeros(nsec)
-        beam_y_ec = np.zeros(nsec)
-
-        # distance to elastic center from airfoil nose
-        # using profile coordinate system
-        self.x_ec_nose = np.zeros(nsec)
-        self.y_ec_nose = np.zeros(nsec)
+        # one row of _precomp.properties results per section, filled in place
+        props = np.empty((nsec, 21))
 
         profile = self.profile
         mat = self.materials
@@ -150,20 +227,10 @@ class PreComp:
         csL = self.lowerCS
         csW = self.websCS
 
-        # arrange materials into array
-        n = len(mat)
-        E1 = [0] * n
-        E2 = [0] * n
-        G12 = [0] * n
-        nu12 = [0] * n
-        rho = [0] * n
-
-        for i in range(n):
-            E1[i] = mat[i].E1
-            E2[i] = mat[i].E2
-            G12[i] = mat[i].G12
-            nu12[i] = mat[i].nu12
-            rho[i] = mat[i].rho
+        # arrange materials into contiguous arrays once, so f2py does not
+        # re-marshal them for every section
+        mat_props = np.array([_MAT_PROPS(m) for m in mat], dtype=np.float64).reshape(-1, 5)
+        E1, E2, G12, nu12, rho = np.ascontiguousarray(mat_props.T)
 
         for i in range(nsec):
             # print(i)
@@ -177,14 +244,9 @@ class PreComp:
 
             # address a bug in f2py (need to pass in length 1 arrays even though they are not used)
             if nwebs == 0:
-                locW = [0]
-                n_laminaW = [0]
-                n_pliesW = [0]
-                tW = [0]
-                thetaW = [0]
-                mat_idxW = [0]
-
-            results = _precomp.properties(
+                locW = n_laminaW = n_pliesW = tW = thetaW = mat_idxW = _NO_WEBS
+
+            props[i, :] = _precomp.properties(
                 self.chord[i],
                 self.theta[i],
                 self.th_prime[i],
@@ -217,29 +279,32 @@ class PreComp:
                 mat_idxW,
             )
 
-            beam_EIxx[i] = results[1]  # EIedge
-            beam_EIyy[i] = results[0]  # EIflat
-            beam_GJ[i] = results[2]
-            beam_EA[i] = results[3]
-            beam_EIxy[i] = results[4]  # EIflapedge
-            beam_x_sc[i] = results[10]
-            beam_y_sc[i] = results[11]
-            beam_x_tc[i] = results[12]
-            beam_y_tc[i] = results[13]
-            beam_x_ec[i] = results[12] - results[10]
-            beam_y_ec[i] = results[13] - results[11]
-            beam_rhoA[i] = results[14]
-            beam_A[i] = results[15]
-            beam_rhoJ[i] = results[16] + results[17]  # perpendicular axis theorem
-            beam_Tw_iner[i] = results[18]
-            beam_x_cg[i] = results[19]
-            beam_y_cg[i] = results[20]
-
-            beam_flap_iner[i] = results[16]
-            beam_edge_iner[i] = results[17]
-
-            self.x_ec_nose[i] = results[13] + self.leLoc[i] * self.chord[i]
-            self.y_ec_nose[i] = results[12]  # switch b.c of coordinate system used
+        beam_EIxx = props[:, 1]  # EIedge
+        beam_EIyy = props[:, 0]  # EIflat
+        beam_GJ = props[:, 2]
+        beam_EA = props[:, 3]
+        beam_EIxy = props[:, 4]  # EIflapedge
+        beam_x_sc = props[:, 10]
+        beam_y_sc = props[:, 11]
+        beam_x_tc = props[:, 12]
+        beam_y_tc = props[:, 13]
+        # distance to elastic center from point about which structural properties are computed
+        # using airfoil coordinate system
+        beam_x_ec = beam_x_tc - beam_x_sc
+        beam_y_ec = beam_y_tc - beam_y_sc
+        beam_rhoA = props[:, 14]
+        beam_A = props[:, 15]
+        beam_flap_iner = props[:, 16]
+        beam_edge_iner = props[:, 17]
+        beam_rhoJ = beam_flap_iner + beam_edge_iner  # perpendicular axis theorem
+        beam_Tw_iner = props[:, 18]
+        beam_x_cg = props[:, 19]
+        beam_y_cg = props[:, 20]
+
+        # distance to elastic center from airfoil nose
+        # using profile coordinate system
+        self.x_ec_nose = beam_y_tc + self.leLoc * self.chord
+        self.y_ec_nose = beam_x_tc  # switch b.c of coordinate system used
 
         return (
             beam_EIxx,
@@ -263,39 +328,46 @@ class PreComp:
             beam_y_cg,
         )
 
-    def criticalStrainLocations(self, sector_idx_strain_ss, sector_idx_strain_ps):
+    def criticalStrainLocations(self, *sector_idx_strain):
+        """Locations of the critical strain points, relative to the elastic center
+
+        The sector indices are given as suction side / pressure side pairs
+        (e.g. spar cap ss, spar cap ps, trailing edge ss, trailing edge ps); all
+        pairs are handled in a single pass and xu, xl, yu, yl are returned for
+        each pair in turn.
+
+        """
         n = len(self.r)
 
         # find location of max thickness on airfoil
-        xun = np.zeros(n)
-        xln = np.zeros(n)
-        yun = np.zeros(n)
-        yln = np.zeros(n)
+        yun = np.zeros((len(sector_idx_strain) // 2, n))
+        yln = np.zeros_like(yun)
 
         # for i, p in enumerate(self.profile):
         #     xun[i], yun[i], yln[i] = p.locationOfMaxThickness()
         # xln = xun
 
-        for i in range(n):
-            csU = self.upperCS[i]
-            csL = self.lowerCS[i]
-            pf = self.profile[i]
-            idx_ss = sector_idx_strain_ss[i]
-            idx_ps = sector_idx_strain_ps[i]
-
-            if idx_ps == None:
-                xln[i] = 0.0
-                yln[i] = 0.0
-            else:
-                xln[i] = 0.5 * (csL.loc[idx_ps] + csL.loc[idx_ps + 1])
-                yln[i] = np.interp(xln[i], pf.x, pf.yl)
+        # chordwise midpoints of the selected sectors, all sections at once
+        validU, xun = sector_midpoints(self.upperCS, *sector_idx_strain[0::2])
+        validL, xln = sector_midpoints(self.lowerCS, *sector_idx_strain[1::2])
+
+        # profiles are normally resampled onto one common chordwise grid, in which
+        # case all sections are interpolated together
+        x = self.profile[0].x
+        if all(np.array_equal(pf.x, x) for pf in self.profile):
+            YU = np.array([pf.yu for pf in self.profile])
+            YL = np.array([pf.yl for pf in self.profile])
+            for k in range(len(yun)):
+                yun[k, validU[k]] = interp_rows(xun[k], x, YU)[validU[k]]
+                yln[k, validL[k]] = interp_rows(xln[k], x, YL)[validL[k]]
+        else:
+            for k, i in zip(*np.nonzero(validU)):
+                pf = self.profile[i]
+                yun[k, i] = np.interp(xun[k, i], pf.x, pf.yu)
 
-            if idx_ss == None:
-                xun[i] = 0.0
-                yun[i] = 0.0
-            else:
-                xun[i] = 0.5 * (csU.loc[idx_ss] + csU.loc[idx_ss + 1])
-                yun[i] = np.interp(xun[i], pf.x, pf.yu)
+            for k, i in zip(*np.nonzero(validL)):
+                pf = self.profile[i]
+                yln[k, i] = np.interp(xln[k, i], pf.x, pf.yl)
 
         # make dimensional and define relative to elastic center
         xu = xun * self.chord - self.x_ec_nose
@@ -307,7 +379,7 @@ class PreComp:
         xu, yu = yu, xu
         xl, yl = yl, xl
 
-        return xu, xl, yu, yl
+        return tuple(v for k in range(len(xu)) for v in (xu[k], xl[k], yu[k], yl[k]))
 
     def panelBucklingStrain(self, sector_idx_array):
         """
@@ -320,35 +392,67 @@ class PreComp:
         chord = self.chord
         nsec = len(self.r)
 
-        eps_crit = np.zeros(nsec)
+        # gather the laminate properties of every panel, then evaluate the
+        # buckling strain of all of them at once
+        valid = np.zeros(nsec, dtype=bool)
+        D_all = np.zeros((nsec, 3, 3))
+        E_all = np.ones(nsec)
+        height = np.ones(nsec)
+        sector_length = np.ones(nsec)
 
         for i in range(nsec):
             cs = self.upperCS[i]  # TODO: lower surface may be the compression one
             sector_idx = sector_idx_array[i]
 
-            if sector_idx == None:
-                eps_crit[i] = 0.0
+            if sector_idx is None:
+                continue
 
-            else:
-                # chord-wise length of sector
-                sector_length = chord[i] * (cs.loc[sector_idx + 1] - cs.loc[sector_idx])
-
-                # get matrices
-                A, B, D, totalHeight = cs.compositeMatrices(sector_idx)
-                E = cs.effectiveEAxial(sector_idx)
-                D1 = D[0, 0]
-                D2 = D[1, 1]
-                D3 = D[0, 1] + 2 * D[2, 2]
+            # chord-wise length of sector
+            sector_length[i] = chord[i] * (cs.loc[sector_idx + 1] - cs.loc[sector_idx])
 
-                # use empirical formula
-                Nxx = 2 * (math.pi / sector_length) ** 2 * (math.sqrt(D1 * D2) + D3)
-                # Nxx = 3.6 * (math.pi/sector_length)**2 * D1
+            # get matrices
+            A, B, D, totalHeight = cs.compositeMatrices(sector_idx)
+            E_all[i] = CompositeSection.axialModulus(A, B, D, totalHeight)
+            D_all[i] = D
+            height[i] = totalHeight
+            valid[i] = True
 
-                eps_crit[i] = -Nxx / totalHeight / E
+        eps_crit = np.where(valid, panel_buckling_strain(D_all, E_all, height, sector_length), 0.0)
 
         return eps_crit
 
 
+def panel_buckling_strain(D, E, totalHeight, sector_length):
+    """Critical strain of a simply supported composite panel in uniaxial compression
+
+    Parameters
+    ----------
+    D : ndarray, shape(..., 3, 3)
+        bending portion of the laminate constitutive matrix
+    E : float or ndarray (N/m^2)
+        effective axial modulus of the laminate
+    totalHeight : float or ndarray (m)
+        total height of the laminate stack
+    sector_length : float or ndarray (m)
+        chord-wise length of the panel
+
+    Returns
+    -------
+    eps_crit : float or ndarray
+        critical (compressive) buckling strain, one per panel
+
+    """
+    D1 = D[..., 0, 0]
+    D2 = D[..., 1, 1]
+    D3 = D[..., 0, 1] + 2 * D[..., 2, 2]
+
+    # use empirical formula
+    Nxx = 2 * (np.pi / sector_length) ** 2 * (np.sqrt(D1 * D2) + D3)
+    # Nxx = 3.6 * (math.pi/sector_length)**2 * D1
+
+    return -Nxx / totalHeight / E
+
+
 def skipLines(f, n):
     for i in range(n):
         f.readline()
@@ -566,12 +670,16 @@ class CompositeSection:
 
         # heights (z - absolute, h - relative to mid-plane)
         z = np.zeros(n + 1)
-        for i in range(n):
-            z[i + 1] = z[i] + t[i] * n_plies[i]
+        z[1:] = np.cumsum(np.asarray(t) * np.asarray(n_plies))
 
         z_mid = (z[-1] - z[0]) / 2.0
         h = z - z_mid
 
+        # lamina thickness weights for the ABD integrals
+        dh1 = np.diff(h)
+        dh2 = 0.5 * np.diff(h**2)
+        dh3 = 1.0 / 3.0 * np.diff(h**3)
+
         # ABD matrices
         A = np.zeros((3, 3))
         B = np.zeros((3, 3))
@@ -579,9 +687,9 @@ class CompositeSection:
 
         for i in range(n):
             Qbar = self.__Qbar(self.materials[mat_idx[i]], theta[i])
-            A += Qbar * (h[i + 1] - h[i])
-            B += 0.5 * Qbar * (h[i + 1] ** 2 - h[i] ** 2)
-            D += 1.0 / 3.0 * Qbar * (h[i + 1] ** 3 - h[i] ** 3)
+            A += Qbar * dh1[i]
+            B += Qbar * dh2[i]
+            D += Qbar * dh3[i]
 
         totalHeight = z[-1] - z[0]
 
@@ -603,6 +711,15 @@ class CompositeSection:
 
         A, B, D, totalHeight = self.compositeMatrices(sector)
 
+        return self.axialModulus(A, B, D, totalHeight)
+
+    @staticmethod
+    def axialModulus(A, B, D, totalHeight):
+        """Effective axial modulus from already computed laminate matrices,
+        see :meth:`effectiveEAxial`
+
+        """
+
         # S = [A B; B D]
 
         S = np.vstack((np.hstack((A, B)), np.hstack((B, D))))
@@ -661,12 +778,9 @@ class CompositeSection:
         if n == 0:
             return self.loc, n_lamina, self.n_plies, self.t, self.theta, self.mat_idx
 
-        for i in range(n):
-            n_lamina[i] = len(self.theta[i])
+        n_lamina[:] = [len(theta_i) for theta_i in self.theta]
 
-        mat = np.concatenate(self.mat_idx)
-        for i in range(len(mat)):
-            mat[i] += 1  # 1-based indexing in Fortran
+        mat = np.concatenate(self.mat_idx) + 1  # 1-based indexing in Fortran
 
         return self.loc, n_lamina, np.concatenate(self.n_plies), np.concatenate(self.t), np.concatenate(self.theta), mat
 
@@ -213,21 +213,19 @@ class RailTransport(ExplicitComponent):
 
         # ---------- Put airfoil cross sections into principle axes
         # Determine principal C.S. (with swap of x, y for profile c.s.)
-        EIxx_cs, EIyy_cs = EIyy.copy(), EIxx.copy()
-        x_sc_cs, y_sc_cs = y_sc.copy(), x_sc.copy()
-        EIxy_cs = EIxy.copy()
-
-        # translate to elastic center
-        EIxx_cs -= y_sc_cs**2 * EA
-        EIyy_cs -= x_sc_cs**2 * EA
-        EIxy_cs -= x_sc_cs * y_sc_cs * EA
+        # and translate to elastic center, out of place so the inputs are left untouched
+        x_sc_cs, y_sc_cs = y_sc, x_sc
+        EIxx_cs = EIyy - y_sc_cs**2 * EA
+        EIyy_cs = EIxx - x_sc_cs**2 * EA
+        EIxy_cs = EIxy - x_sc_cs * y_sc_cs * EA
 
         # get rotation angle
         alpha = 0.5 * np.arctan2(2 * EIxy_cs, EIyy_cs - EIxx_cs)
 
         # get moments and positions in principal axes
-        EI11 = EIxx_cs - EIxy_cs * np.tan(alpha)
-        EI22 = EIyy_cs + EIxy_cs * np.tan(alpha)
+        EIxy_tan = EIxy_cs * np.tan(alpha)
+        EI11 = EIxx_cs - EIxy_tan
+        EI22 = EIyy_cs + EIxy_tan
         ca = np.cos(alpha)
         sa = np.sin(alpha)
 
@@ -436,23 +434,26 @@ class RailTransport(ExplicitComponent):
         # plt.show()
         # exit()
 
+        dr = np.diff(r)[:, np.newaxis]
+
         def get_max_force_h(FrIn):
             # Objective function to minimize the reaction force of the first flatcat, which holds blade root, during a lateral curve
             Fr = FrIn[2:].reshape((self.n_span - 1, 2))
-            RF_flatcar_1 = np.zeros(2)
-            for k in range(2):
-                q_iter = np.r_[0.0, Fr[:, k]]
-                V_iter = np.zeros(self.n_span)
-                M_iter = np.zeros(self.n_span)
-                for i in range(self.n_span):
-                    V_iter[i] = np.trapz(q_iter[i:], r[i:])
-                for i in range(self.n_span):
-                    M_iter[i] = np.trapz(V_iter[i:], r[i:])
 
-                RF_flatcar_1[k] = 0.5 * V_iter[0] + M_iter[0] / flatcar_tc_length
+            # Shear and moment integrated from the tip, one trapezoid pass for both directions
+            q_iter = np.r_[np.zeros((1, 2)), Fr]
+            V_iter = np.zeros((self.n_span, 2))
+            V_iter[:-1] = np.cumsum((0.5 * (q_iter[1:] + q_iter[:-1]) * dr)[::-1], axis=0)[::-1]
+            M_root = np.sum(0.5 * (V_iter[1:] + V_iter[:-1]) * dr, axis=0)
+
+            RF_flatcar_1 = 0.5 * V_iter[0] + M_root / flatcar_tc_length
 
             return np.sum(abs(RF_flatcar_1) * 1.0e-5)
 
+        # Frame3DD objects for the bends towards SS and PS, only their nodes change between evaluations
+        blade1 = pyframe3dd.Frame(pyframe3dd.NodeData(inode, x_ref, y_ref, z_ref, rad), reactions, elements, options)
+        blade2 = pyframe3dd.Frame(pyframe3dd.NodeData(inode, x_ref, y_ref, z_ref, rad), reactions, elements, options)
+
         # Function that does the structural analysis to be called during optimization
         def run_hcurve(FrIn, optFlag=True, final=False):
             angle = FrIn[0:2]
@@ -469,9 +470,9 @@ class RailTransport(ExplicitComponent):
             x_rot2, z_rot2 = util.rotate(-r_curveH, 0.0, -r_curveH + x_ref, z_ref, angle[1])
             nodes2 = pyframe3dd.NodeData(inode, x_rot2, y_ref, z_rot2, rad)
 
-            # Initialize Frame3dd objects
-            blade1 = pyframe3dd.Frame(nodes1, reactions, elements, options)
-            blade2 = pyframe3dd.Frame(nodes2, reactions, elements, options)
+            # Update the Frame3dd objects
+            blade1.set_nodes(nodes1)
+            blade2.set_nodes(nodes2)
 
             Fr = FrIn[2:].reshape((self.n_span - 1, 2))
 
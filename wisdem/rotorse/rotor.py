@@ -156,7 +156,7 @@ class RotorSE(om.Group):
             self.connect("rc.total_blade_cost", "total_bc.inner_blade_cost")
 
         # Connection from ra to rs for the rated conditions
-        self.connect("rp.gust.V_gust", ["rs.aero_gust.V_load", "rs.aero_hub_loads.V_load"])
+        self.connect("rp.gust.V_gust", "rs.V_load")
         self.connect(
             "rp.powercurve.rated_Omega", ["rs.Omega_load", "rs.tot_loads_gust.aeroloads_Omega", "rs.constr.rated_Omega"]
         )
@@ -517,14 +517,28 @@ class RunPreComp(ExplicitComponent):
             material_dict[discrete_inputs["mat_name"][i_mat]] = i_mat
 
         ## Spanwise
+        # bind the input arrays once, they are indexed many times per section and layer
+        r = inputs["r"]
+        coord_xy_interp = inputs["coord_xy_interp"]
+        pitch_axis = inputs["pitch_axis"]
+        twist = inputs["theta"]
+        layer_thickness = inputs["layer_thickness"]
+        fiber_orientation = inputs["fiber_orientation"]
+        layer_start_nd = inputs["layer_start_nd"]
+        layer_end_nd = inputs["layer_end_nd"]
+        layer_web = inputs["layer_web"]
+        web_start_nd = inputs["web_start_nd"]
+        web_end_nd = inputs["web_end_nd"]
+        definition_layer = discrete_inputs["definition_layer"]
+
         for i in range(self.n_span):
             # time0 = time.time()
 
             ## Profiles
             # rotate
-            profile_i = inputs["coord_xy_interp"][i, :, :]
+            profile_i = coord_xy_interp[i, :, :]
             profile_i_rot = np.column_stack(
-                rotate(inputs["pitch_axis"][i], 0.0, profile_i[:, 0], profile_i[:, 1], np.radians(inputs["theta"][i]))
+                rotate(pitch_axis[i], 0.0, profile_i[:, 0], profile_i[:, 1], np.radians(twist[i]))
             )
 
             # import matplotlib.pyplot as plt
@@ -600,13 +614,15 @@ class RunPreComp(ExplicitComponent):
 
             # time1 = time.time()
             for idx_sec in range(self.n_layers):
-                if discrete_inputs["definition_layer"][idx_sec] != 10:
-                    if inputs["layer_thickness"][idx_sec, i] > 1.0e-6:
-                        if inputs["layer_start_nd"][idx_sec, i] < loc_LE or inputs["layer_end_nd"][idx_sec, i] < loc_LE:
+                if definition_layer[idx_sec] != 10:
+                    start_nd = layer_start_nd[idx_sec, i]
+                    end_nd = layer_end_nd[idx_sec, i]
+                    if layer_thickness[idx_sec, i] > 1.0e-6:
+                        if start_nd < loc_LE or end_nd < loc_LE:
                             ss_idx.append(idx_sec)
-                            if inputs["layer_start_nd"][idx_sec, i] < loc_LE:
+                            if start_nd < loc_LE:
                                 # ss_start_nd_arc.append(sec['start_nd_arc']['values'][i])
-                                ss_end_nd_arc_temp = float(spline_arc2xnd(inputs["layer_start_nd"][idx_sec, i]))
+                                ss_end_nd_arc_temp = float(spline_arc2xnd(start_nd))
                                 if ss_end_nd_arc_temp > 1 or ss_end_nd_arc_temp < 0:
                                     raise ValueError(
                                         "Error in the definition of material "
@@ -614,7 +630,7 @@ class RunPreComp(ExplicitComponent):
                                         + ". It cannot fit in the section number "
                                         + str(i)
                                         + " at span location "
-                                        + str(inputs["r"][i] / inputs["r"][-1] * 100.0)
+                                        + str(r[i] / r[-1] * 100.0)
                                         + " %."
                                     )
                                 if ss_end_nd_arc_temp == profile_i_rot[0, 0] and profile_i_rot[0, 0] != 1.0:
@@ -623,24 +639,21 @@ class RunPreComp(ExplicitComponent):
                             else:
                                 ss_end_nd_arc.append(1.0)
                             # ss_end_nd_arc.append(min(sec['end_nd_arc']['values'][i], loc_LE)/loc_LE)
-                            if inputs["layer_end_nd"][idx_sec, i] < loc_LE:
-                                ss_start_nd_arc.append(float(spline_arc2xnd(inputs["layer_end_nd"][idx_sec, i])))
+                            if end_nd < loc_LE:
+                                ss_start_nd_arc.append(float(spline_arc2xnd(end_nd)))
                             else:
                                 ss_start_nd_arc.append(0.0)
 
-                        if inputs["layer_start_nd"][idx_sec, i] > loc_LE or inputs["layer_end_nd"][idx_sec, i] > loc_LE:
+                        if start_nd > loc_LE or end_nd > loc_LE:
                             ps_idx.append(idx_sec)
                             # ps_start_nd_arc.append((max(sec['start_nd_arc']['values'][i], loc_LE)-loc_LE)/len_PS)
                             # ps_end_nd_arc.append((min(sec['end_nd_arc']['values'][i], 1.)-loc_LE)/len_PS)
 
-                            if (
-                                inputs["layer_start_nd"][idx_sec, i] > loc_LE
-                                and inputs["layer_end_nd"][idx_sec, i] < loc_LE
-                            ):
+                            if start_nd > loc_LE and end_nd < loc_LE:
                                 # ps_start_nd_arc.append(float(remap2grid(profile_i_arc, profile_i_rot[:,0], sec['start_nd_arc']['values'][i])))
                                 ps_end_nd_arc.append(1.0)
                             else:
-                                ps_end_nd_arc_temp = float(spline_arc2xnd(inputs["layer_end_nd"][idx_sec, i]))
+                                ps_end_nd_arc_temp = float(spline_arc2xnd(end_nd))
                                 if (
                                     np.isclose(ps_end_nd_arc_temp, profile_i_rot[-1, 0], atol=1.0e-2)
                                     and profile_i_rot[-1, 0] != 1.0
@@ -649,18 +662,18 @@ class RunPreComp(ExplicitComponent):
                                 if ps_end_nd_arc_temp > 1.0:
                                     ps_end_nd_arc_temp = 1.0
                                 ps_end_nd_arc.append(ps_end_nd_arc_temp)
-                            if inputs["layer_start_nd"][idx_sec, i] < loc_LE:
+                            if start_nd < loc_LE:
                                 ps_start_nd_arc.append(0.0)
                             else:
-                                ps_start_nd_arc.append(float(spline_arc2xnd(inputs["layer_start_nd"][idx_sec, i])))
+                                ps_start_nd_arc.append(float(spline_arc2xnd(start_nd)))
                 else:
-                    target_idx = inputs["layer_web"][idx_sec] - 1
+                    target_idx = layer_web[idx_sec] - 1
 
-                    if inputs["layer_thickness"][idx_sec, i] > 1.0e-6:
+                    if layer_thickness[idx_sec, i] > 1.0e-6:
                         web_idx.append(idx_sec)
 
-                        start_nd_arc = float(spline_arc2xnd(inputs["web_start_nd"][int(target_idx), i]))
-                        end_nd_arc = float(spline_arc2xnd(inputs["web_end_nd"][int(target_idx), i]))
+                        start_nd_arc = float(spline_arc2xnd(web_start_nd[int(target_idx), i]))
+                        end_nd_arc = float(spline_arc2xnd(web_end_nd[int(target_idx), i]))
 
                         web_start_nd_arc.append(start_nd_arc)
                         web_end_nd_arc.append(end_nd_arc)
@@ -677,8 +690,8 @@ class RunPreComp(ExplicitComponent):
                 ss_start_nd_arc,
                 ss_end_nd_arc,
                 layer_name,
-                inputs["layer_thickness"][:, i],
-                inputs["fiber_orientation"][:, i],
+                layer_thickness[:, i],
+                fiber_orientation[:, i],
                 layer_mat,
                 material_dict,
                 materials,
@@ -690,8 +703,8 @@ class RunPreComp(ExplicitComponent):
                 ps_start_nd_arc,
                 ps_end_nd_arc,
                 layer_name,
-                inputs["layer_thickness"][:, i],
-                inputs["fiber_orientation"][:, i],
+                layer_thickness[:, i],
+                fiber_orientation[:, i],
                 layer_mat,
                 material_dict,
                 materials,
@@ -703,8 +716,8 @@ class RunPreComp(ExplicitComponent):
                     web_idx,
                     web_start_nd_arc,
                     web_end_nd_arc,
-                    inputs["layer_thickness"][:, i],
-                    inputs["fiber_orientation"][:, i],
+                    layer_thickness[:, i],
+                    fiber_orientation[:, i],
                     layer_mat,
                     material_dict,
                     materials,
@@ -729,9 +742,9 @@ class RunPreComp(ExplicitComponent):
 
         # Get Beam Properties
         beam = PreComp(
-            inputs["r"],
+            r,
             inputs["chord"],
-            np.zeros_like(inputs["r"]),
+            np.zeros_like(r),
             inputs["pitch_axis"],
             inputs["precurve"],
             inputs["presweep"],
@@ -770,10 +783,18 @@ class RunPreComp(ExplicitComponent):
         # outputs['eps_crit_spar'] = beam.panelBucklingStrain(sector_idx_spar_cap_ss)
         # outputs['eps_crit_te'] = beam.panelBucklingStrain(sector_idx_te_ss)
 
-        xu_spar, xl_spar, yu_spar, yl_spar = beam.criticalStrainLocations(
-            sector_idx_spar_cap_ss, sector_idx_spar_cap_ps
+        (
+            xu_spar,
+            xl_spar,
+            yu_spar,
+            yl_spar,
+            xu_te,
+            xl_te,
+            yu_te,
+            yl_te,
+        ) = beam.criticalStrainLocations(
+            sector_idx_spar_cap_ss, sector_idx_spar_cap_ps, sector_idx_te_ss, sector_idx_te_ps
         )
-        xu_te, xl_te, yu_te, yl_te = beam.criticalStrainLocations(sector_idx_te_ss, sector_idx_te_ps)
 
         # Store what materials make up the composites for SC/TE
         for i in range(self.n_span):
@@ -790,19 +811,20 @@ class RunPreComp(ExplicitComponent):
                 if sector_idx_te_ps[i]:
                     if j in lowerCS[i].mat_idx[sector_idx_te_ps[i]]:
                         outputs["te_ps_mats"][i, j] = 1.0
-        rhoA_joint = copy.copy(rhoA)
+        # the joint mass is added directly to the output buffer, rhoA stays the bare blade
+        outputs["rhoA"] = rhoA
         if inputs["joint_mass"] > 0.0:
-            s = (inputs["r"] - inputs["r"][0]) / (inputs["r"][-1] - inputs["r"][0])
+            s = (r - r[0]) / (r[-1] - r[0])
             id_station = np.argmin(abs(inputs["joint_position"] - s))
             span = np.average(
                 [
-                    inputs["r"][id_station] - inputs["r"][id_station - 1],
-                    inputs["r"][id_station + 1] - inputs["r"][id_station],
+                    r[id_station] - r[id_station - 1],
+                    r[id_station + 1] - r[id_station],
                 ]
             )
-            rhoA_joint[id_station] += inputs["joint_mass"] / span
+            outputs["rhoA"][id_station] += inputs["joint_mass"] / span
 
-        outputs["z"] = inputs["r"]
+        outputs["z"] = r
         outputs["EIxx"] = EIxx
         outputs["EIyy"] = EIyy
         outputs["GJ"] = GJ
@@ -810,7 +832,6 @@ class RunPreComp(ExplicitComponent):
         outputs["EIxy"] = EIxy
         outputs["x_ec"] = x_ec
         outputs["y_ec"] = y_ec
-        outputs["rhoA"] = rhoA_joint
         outputs["A"] = area
         outputs["rhoJ"] = rhoJ
         outputs["Tw_iner"] = Tw_iner
@@ -834,19 +855,13 @@ class RunPreComp(ExplicitComponent):
         outputs["yl_te"] = yl_te
 
         # Compute mass and inertia of blade and rotor
-        blade_mass = np.trapz(rhoA, inputs["r"])
-        blade_moment_of_inertia = np.trapz(rhoA_joint * inputs["r"] ** 2.0, inputs["r"])
-        tilt = inputs["uptilt"]
+        blade_mass = np.trapz(rhoA, r)
+        blade_moment_of_inertia = np.trapz(outputs["rhoA"] * r ** 2.0, r)
         n_blades = discrete_inputs["n_blades"]
         mass_all_blades = n_blades * blade_mass
-        Ibeam = n_blades * blade_moment_of_inertia
-        Ixx = Ibeam
-        Iyy = Ibeam / 2.0  # azimuthal average for 2 blades, exact for 3+
-        Izz = Ibeam / 2.0
-        Ixy = 0.0
-        Ixz = 0.0
-        Iyz = 0.0  # azimuthal average for 2 blades, exact for 3+
-        I_all_blades = np.r_[Ixx, Iyy, Izz, Ixy, Ixz, Iyz]
+        # Ixx, Iyy, Izz, Ixy, Ixz, Iyz as fractions of the flapwise inertia of all blades
+        # (Iyy, Izz and Iyz are the azimuthal average for 2 blades, exact for 3+)
+        I_all_blades = (n_blades * blade_moment_of_inertia) * np.array([1.0, 0.5, 0.5, 0.0, 0.0, 0.0])
 
         outputs["blade_mass"] = blade_mass
         outputs["blade_moment_of_inertia"] = blade_moment_of_inertia
@@ -14,7 +14,7 @@ from scipy.interpolate import PchipInterpolator
 
 from wisdem.ccblade.Polar import Polar
 from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
-from wisdem.commonse.utilities import smooth_abs, smooth_min, linspace_with_deriv
+from wisdem.commonse.utilities import smooth_abs, smooth_min, trapz_deriv, linspace_with_deriv
 from wisdem.commonse.distribution import RayleighCDF, WeibullWithMeanCDF
 
 logger = logging.getLogger("wisdem/weis")
@@ -89,6 +89,9 @@ class RotorPower(Group):
 class GustETM(ExplicitComponent):
     # OpenMDAO component that generates an "equivalent gust" wind speed by summing an user-defined wind speed at hub height with 3 times sigma. sigma is the turbulent wind speed standard deviation for the extreme turbulence model, see IEC-61400-1 Eq. 19 paragraph 6.3.2.3
 
+    # IEC 61400-1 reference turbulence intensity per turbulence class
+    Iref = {"A": 0.16, "B": 0.14, "C": 0.12}
+
     def initialize(self):
         # number of standard deviations for strength of gust
         self.options.declare("std", default=3.0)
@@ -108,13 +111,9 @@ class GustETM(ExplicitComponent):
         std = self.options["std"]
         turbulence_class = discrete_inputs["turbulence_class"]
 
-        if turbulence_class.upper() == "A":
-            Iref = 0.16
-        elif turbulence_class.upper() == "B":
-            Iref = 0.14
-        elif turbulence_class.upper() == "C":
-            Iref = 0.12
-        else:
+        try:
+            Iref = self.Iref[turbulence_class.upper()]
+        except KeyError:
             raise ValueError("Unknown Turbulence Class: " + str(turbulence_class) + " . Permitted values are A / B / C")
 
         c = 2.0
@@ -853,17 +852,15 @@ class ComputeSplines(ExplicitComponent):
         self.declare_partials(of="Omega_spline", wrt="Omega", method="fd")
 
     def compute(self, inputs, outputs):
-        # Fit spline to powercurve for higher grid density
-        V_spline = np.linspace(inputs["v_min"], inputs["v_max"], self.n_pc_spline)
-        spline = PchipInterpolator(inputs["V"], inputs["P"])
-        P_spline = spline(V_spline)
-        spline = PchipInterpolator(inputs["V"], inputs["Omega"])
-        Omega_spline = spline(V_spline)
+        # Fit spline to powercurve for higher grid density, power and rotor speed share the knots
+        V_spline = np.linspace(inputs["v_min"], inputs["v_max"], self.n_pc_spline).flatten()
+        spline = PchipInterpolator(inputs["V"], np.c_[inputs["P"], inputs["Omega"]])
+        P_spline, Omega_spline = spline(V_spline).T
 
         # outputs
-        outputs["V_spline"] = V_spline.flatten()
-        outputs["P_spline"] = P_spline.flatten()
-        outputs["Omega_spline"] = Omega_spline.flatten()
+        outputs["V_spline"] = V_spline
+        outputs["P_spline"] = P_spline
+        outputs["Omega_spline"] = Omega_spline
 
     def compute_partials(self, inputs, partials):
         linspace_with_deriv
@@ -962,7 +959,7 @@ class AEP(ExplicitComponent):
         # outputs
         self.add_output("AEP", val=0.0, units="kW*h", desc="annual energy production")
 
-        # self.declare_partials('*', '*', method='fd', form='central', step=1e-6)
+        self.declare_partials("AEP", ["CDF_V", "P", "lossFactor"])
 
     def compute(self, inputs, outputs):
         lossFactor = inputs["lossFactor"]
@@ -971,20 +968,19 @@ class AEP(ExplicitComponent):
 
         factor = lossFactor / 1e3 * 365.0 * 24.0
         outputs["AEP"] = factor * np.trapz(P, CDF_V)  # in kWh
-        """
-        dAEP_dP, dAEP_dCDF = trapz_deriv(P, CDF_V)
-        dAEP_dP *= factor
-        dAEP_dCDF *= factor
-
-        dAEP_dlossFactor = np.array([outputs['AEP']/lossFactor])
-        self.J = {}
-        self.J['AEP', 'CDF_V'] = np.reshape(dAEP_dCDF, (1, len(dAEP_dCDF)))
-        self.J['AEP', 'P'] = np.reshape(dAEP_dP, (1, len(dAEP_dP)))
-        self.J['AEP', 'lossFactor'] = dAEP_dlossFactor
 
     def compute_partials(self, inputs, J):
-        J = self.J
-        """
+        lossFactor = inputs["lossFactor"]
+        P = inputs["P"]
+        CDF_V = inputs["CDF_V"]
+
+        factor = lossFactor / 1e3 * 365.0 * 24.0
+        dAEP_dP, dAEP_dCDF = trapz_deriv(P, CDF_V)
+
+        # Row partials of a scalar output can be given flat
+        J["AEP", "CDF_V"] = factor * dAEP_dCDF
+        J["AEP", "P"] = factor * dAEP_dP
+        J["AEP", "lossFactor"] = np.trapz(P, CDF_V) / 1e3 * 365.0 * 24.0
 
 
 def compute_P_and_eff(aeroPower, ratedPower, Omega_rpm, drivetrainType, drivetrainEff):
@@ -18,6 +18,8 @@ logger = logging.getLogger("wisdem/weis")
 
 class BladeCurvature(ExplicitComponent):
     # OpenMDAO component that computes the 3D curvature of the blade
+    _curv_inputs = ("r", "precurve", "presweep", "precone")
+
     def initialize(self):
         self.options.declare("modeling_options")
 
@@ -45,31 +47,93 @@ class BladeCurvature(ExplicitComponent):
         )
         self.add_output("s", val=np.zeros(n_span), units="m", desc="cumulative path length along blade")
 
-    def compute(self, inputs, outputs):
+        # Cone angles couple neighboring nodes, arc length accumulates from the root and
+        # the azimuthal coordinates are the inputs themselves (constant identity blocks)
+        arange = np.arange(n_span)
+        self.band_rows, self.band_cols = np.nonzero(np.abs(arange[:, np.newaxis] - arange) <= 1)
+        self.tril_rows, self.tril_cols = np.tril_indices(n_span)
+        # Flat positions of the band entries in the stacked (lower, diagonal, upper) node terms and of the
+        # tril entries in the stacked (diagonal, below diagonal) node terms formed in compute_partials
+        self.band_src = (self.band_cols - self.band_rows + 1) * n_span + self.band_rows
+        self.tril_src = np.where(self.tril_rows == self.tril_cols, 0, n_span) + self.tril_cols
+        self.tril_root = np.flatnonzero(self.tril_cols == 0)
+        # Each node's cone angle is its segment angle at the ends and the average of its two segments inside
+        self.cone_w = np.full((n_span, 1), 0.5)
+        self.cone_w[0] = self.cone_w[-1] = 1.0
+        self.declare_partials("3d_curv", ["r", "precurve"], rows=self.band_rows, cols=self.band_cols)
+        self.declare_partials("3d_curv", "precone", val=1.0)
+        self.declare_partials("x_az", "precurve", rows=arange, cols=arange, val=1.0)
+        self.declare_partials("y_az", "presweep", rows=arange, cols=arange, val=1.0)
+        self.declare_partials("z_az", "r", rows=arange, cols=arange, val=1.0)
+        self.declare_partials("s", ["r", "precurve", "presweep"], rows=self.tril_rows, cols=self.tril_cols)
+
+    def _build_curvature(self, inputs):
         r = inputs["r"]
         precurve = inputs["precurve"]
         presweep = inputs["presweep"]
         precone = inputs["precone"]
 
-        n = len(r)
-        dx_dx = np.eye(3 * n)
-
-        x_az, x_azd, y_az, y_azd, z_az, z_azd, cone, coned, s, sd = _bem.definecurvature_dv2(
-            r, dx_dx[:, :n], precurve, dx_dx[:, n : 2 * n], presweep, dx_dx[:, 2 * n :], 0.0, np.zeros(3 * n)
-        )
+        # Derivatives are only evaluated in compute_partials
+        x_az, y_az, z_az, cone, s = _bem.definecurvature(r, precurve, presweep, 0.0)
 
         totalCone = precone + np.degrees(cone)
         s = r[0] + s
 
+        return totalCone, x_az, y_az, z_az, s
+
+    def compute(self, inputs, outputs):
+        # The blade geometry is unchanged while other design variables are perturbed, so reuse the last curvature
+        totalCone, x_az, y_az, z_az, s = util.memo_inputs(self, self._curv_inputs, inputs, self._build_curvature)
+
         outputs["3d_curv"] = totalCone
         outputs["x_az"] = x_az
         outputs["y_az"] = y_az
         outputs["z_az"] = z_az
         outputs["s"] = s
 
+    def compute_partials(self, inputs, J):
+        r = inputs["r"]
+        precurve = inputs["precurve"]
+        presweep = inputs["presweep"]
+
+        # With zero precone the azimuthal coordinates are the inputs themselves
+        # (x_az = precurve, y_az = presweep, z_az = r), so only the segment
+        # angles atan2(-dpc, dr) and lengths need differentiating
+        dr = np.diff(r)
+        dpc = np.diff(precurve)
+        dps = np.diff(presweep)
+
+        # in-plane segment lengths squared are shared by the cone angles and the arc length
+        q = dr**2 + dpc**2
+
+        # Every segment slope lands on the node band as (lower, diagonal, upper), columns are
+        # the r and precurve slopes, with radians to degrees folded into the per-segment factors
+        inv_q = np.degrees(1.0 / q)
+        slope = np.vstack((np.zeros((1, 2)), np.c_[dpc, -dr] * inv_q[:, np.newaxis], np.zeros((1, 2))))
+        w_prev = self.cone_w * slope[:-1]
+        w_next = self.cone_w * slope[1:]
+        dcone = np.vstack((-w_prev, w_prev - w_next, w_next))[self.band_src]
+
+        # Arc length to node m sums the segment slopes below it: the diagonal carries the last
+        # segment and every column below the diagonal the difference of its two neighboring segments
+        inv_ds = 1.0 / np.sqrt(q + dps**2)
+        slope = np.vstack((np.zeros((1, 3)), np.c_[dr, dpc, dps] * inv_ds[:, np.newaxis]))
+        ds = np.vstack((slope, slope[:-1] - slope[1:], np.zeros((1, 3))))[self.tril_src]
+        ds[self.tril_root, 0] += 1.0  # s = r[0] + s
+
+        J["3d_curv", "r"] = dcone[:, 0]
+        J["3d_curv", "precurve"] = dcone[:, 1]
+        J["s", "r"] = ds[:, 0]
+        J["s", "precurve"] = ds[:, 1]
+        J["s", "presweep"] = ds[:, 2]
+
 
 class TotalLoads(ExplicitComponent):
     # OpenMDAO component that takes as input the rotor configuration (tilt, cone), the blade twist and mass distributions, and the blade aerodynamic loading, and computes the total loading including gravity and centrifugal forces
+    # Load names in x, y, z order, shared by the partials declaration and the Jacobian fill
+    _P_af = ("Px_af", "Py_af", "Pz_af")
+    _P_aero = ("aeroloads_Px", "aeroloads_Py", "aeroloads_Pz")
+
     def initialize(self):
         self.options.declare("modeling_options")
 
@@ -110,44 +174,102 @@ class TotalLoads(ExplicitComponent):
             "Pz_af", val=np.zeros(n_span), units="N/m", desc="total distributed loads in airfoil z-direction"
         )
 
-    def compute(self, inputs, outputs):
-        dynamicFactor = inputs["dynamicFactor"]
-        r = inputs["r"]
-        theta = inputs["theta"]
+        # Every spanwise output depends only on the inputs at the same station plus the scalar operating state
+        arange = np.arange(n_span)
+        P_af = list(self._P_af)
+        self.declare_partials(
+            P_af,
+            list(self._P_aero) + ["theta", "3d_curv", "z_az", "rhoA"],
+            rows=arange,
+            cols=arange,
+        )
+        self.declare_partials(
+            P_af, ["aeroloads_Omega", "aeroloads_pitch", "aeroloads_azimuth", "tilt", "dynamicFactor"]
+        )
+
+    def _rotate_loads(self, inputs):
+        n = len(inputs["r"])
+        zeros = np.zeros(n)
+        ones = np.ones(n)
         tilt = inputs["tilt"]
+        azimuth = inputs["aeroloads_azimuth"]
         totalCone = inputs["3d_curv"]
-        z_az = inputs["z_az"]
-        rhoA = inputs["rhoA"]
+        twist = inputs["theta"] + inputs["aeroloads_pitch"]
 
         # keep all in blade c.s. then rotate all at end
 
-        # --- aero loads ---
-        P_a = DirectionVector(0, 0, 0)
-        P_a.x, P_a.y, P_a.z = inputs["aeroloads_Px"], inputs["aeroloads_Py"], inputs["aeroloads_Pz"]
-
-        # --- weight loads ---
-        # yaw c.s.
-        weight = DirectionVector(0.0, 0.0, -rhoA * gravity)
-        P_w = weight.yawToHub(tilt).hubToAzimuth(inputs["aeroloads_azimuth"]).azimuthToBlade(totalCone)
-
-        # --- centrifugal loads ---
-        # azimuthal c.s.
+        # --- weight (yaw c.s.) and centrifugal loads, both carried into the azimuthal c.s. ---
+        weight = -inputs["rhoA"] * gravity
         Omega = inputs["aeroloads_Omega"] * RPM2RS
-        load = DirectionVector(0.0, 0.0, rhoA * Omega**2 * z_az)
-        P_c = load.azimuthToBlade(totalCone)
+        ct, st = util.cosd(tilt), util.sind(tilt)
+        ca, sa = util.cosd(azimuth), util.sind(azimuth)
+        P_az = np.array([-weight * st, weight * ct * sa, weight * ct * ca + inputs["rhoA"] * Omega**2 * inputs["z_az"]])
+
+        # --- azimuthal to blade c.s. (cone) and blade to airfoil c.s. (twist + pitch), one 3x3 per station ---
+        cc, sc = util.cosd(totalCone), util.sind(totalCone)
+        R_cone = np.array([[cc, zeros, sc], [zeros, ones, zeros], [-sc, zeros, cc]])
+        cb, sb = util.cosd(twist), util.sind(twist)
+        R_twist = np.array([[cb, -sb, zeros], [sb, cb, zeros], [zeros, zeros, ones]])
 
         # --- total loads ---
-        P = P_a + P_w + P_c
+        P_aero = np.array([inputs["aeroloads_Px"], inputs["aeroloads_Py"], inputs["aeroloads_Pz"]])
+        P_blade = P_aero + np.einsum("ijn,jn->in", R_cone, P_az)
 
         # rotate to airfoil c.s.
-        P = P.bladeToAirfoil(theta + inputs["aeroloads_pitch"])
+        P_af = np.einsum("ijn,jn->in", R_twist, P_blade)
+
+        return P_az, P_aero, P_blade, R_twist, R_cone, P_af
 
-        outputs["Px_af"] = dynamicFactor * P.x
-        outputs["Py_af"] = dynamicFactor * P.y
-        outputs["Pz_af"] = dynamicFactor * P.z
+    def compute(self, inputs, outputs):
+        P_af = inputs["dynamicFactor"] * self._rotate_loads(inputs)[-1]
+
+        outputs["Px_af"], outputs["Py_af"], outputs["Pz_af"] = P_af
+
+    def compute_partials(self, inputs, J):
+        n = len(inputs["r"])
+        zeros = np.zeros(n)
+        dynamicFactor = inputs["dynamicFactor"]
+        z_az = inputs["z_az"]
+        rhoA = inputs["rhoA"]
+        Omega = inputs["aeroloads_Omega"] * RPM2RS
+        weight = -rhoA * gravity
+        # Scalar angles broadcast across the span as read-only views rather than scaled copies of np.ones
+        ct, st = np.broadcast_to(util.cosd(inputs["tilt"]), n), np.broadcast_to(util.sind(inputs["tilt"]), n)
+        azimuth = inputs["aeroloads_azimuth"]
+        ca, sa = np.broadcast_to(util.cosd(azimuth), n), np.broadcast_to(util.sind(azimuth), n)
+        P_az, P_aero, P_blade, R_twist, R_cone, P_af = self._rotate_loads(inputs)
+        deg = np.pi / 180.0
+
+        # Azimuthal c.s. load sensitivities, chained through both rotations in one contraction
+        dPaz = {
+            "rhoA": np.array([gravity * st, -gravity * ct * sa, -gravity * ct * ca + Omega**2 * z_az]),
+            "z_az": np.array([zeros, zeros, rhoA * Omega**2]),
+            "aeroloads_Omega": np.array([zeros, zeros, 2.0 * rhoA * Omega * z_az * RPM2RS]),
+            "tilt": -deg * weight * np.array([ct, st * sa, st * ca]),
+            "aeroloads_azimuth": deg * weight * np.array([zeros, ct * ca, -ct * sa]),
+        }
+        R_total = np.einsum("ijn,jkn->ikn", R_twist, R_cone)
+        dPaf = dynamicFactor * np.einsum("ikn,mkn->imn", R_total, np.array(list(dPaz.values())))
+
+        # Rotation angle derivatives follow from the rotated vectors themselves
+        P_cone = P_blade - P_aero
+        dPaf_dcone = dynamicFactor * np.einsum("ijn,jn->in", R_twist, deg * np.array([P_cone[2], zeros, -P_cone[0]]))
+        dPaf_dtwist = dynamicFactor * deg * np.array([-P_af[1], P_af[0], zeros])
+
+        for i, name in enumerate(self._P_af):
+            for m, wrt in enumerate(dPaz):
+                J[name, wrt] = dPaf[i, m]
+            for j, wrt in enumerate(self._P_aero):
+                J[name, wrt] = dynamicFactor * R_twist[i, j]
+            J[name, "3d_curv"] = dPaf_dcone[i]
+            J[name, "theta"] = J[name, "aeroloads_pitch"] = dPaf_dtwist[i]
+            J[name, "dynamicFactor"] = P_af[i]
 
 
 class RunFrame3DD(ExplicitComponent):
+    # Section properties that define the frame, everything else is a load
+    _frame_inputs = ("r", "theta", "x_ec", "y_ec", "A", "rhoA", "rhoJ", "GJ", "EA", "EIxx", "EIyy", "EIxy")
+
     def initialize(self):
         self.options.declare("modeling_options")
         self.options.declare("pbeam", default=False)  # Recover old pbeam c.s. and accuracy
@@ -323,12 +445,9 @@ class RunFrame3DD(ExplicitComponent):
             desc="axial resultant along blade span",
         )
 
-    def compute(self, inputs, outputs):
+    def _build_frame(self, inputs):
         # Unpack inputs
         r = inputs["r"]
-        x_az = inputs["x_az"]
-        y_az = inputs["y_az"]
-        z_az = inputs["z_az"]
         theta = inputs["theta"]
         x_ec = inputs["x_ec"]
         y_ec = inputs["y_ec"]
@@ -340,35 +459,30 @@ class RunFrame3DD(ExplicitComponent):
         EIxx = inputs["EIxx"]
         EIyy = inputs["EIyy"]
         EIxy = inputs["EIxy"]
-        Px_af = inputs["Px_af"]
-        Py_af = inputs["Py_af"]
-        Pz_af = inputs["Pz_af"]
         # np.savez('nrel5mw_test.npz',r=r,x_az=x_az,y_az=y_az,z_az=z_az,theta=theta,x_ec=x_ec,y_ec=y_ec,A=A,rhoA=rhoA,rhoJ=rhoJ,GJ=GJ,EA=EA,EIxx=EIxx,EIyy=EIyy,EIxy=EIxy,Px_af=Px_af,Py_af=Py_af,Pz_af=Pz_af)
 
         # Determine principal C.S. (with swap of x, y for profile c.s.)
         # Can get to Hansen's c.s. from Precomp's c.s. by rotating around z -90 deg, then y by 180 (swap x-y)
-        EIxx_cs, EIyy_cs = EIyy.copy(), EIxx.copy()
-        x_ec_cs, y_ec_cs = y_ec.copy(), x_ec.copy()
-        EIxy_cs = EIxy.copy()
-
-        # translate to elastic center
-        EIxx_cs -= y_ec_cs**2 * EA
-        EIyy_cs -= x_ec_cs**2 * EA
-        EIxy_cs -= x_ec_cs * y_ec_cs * EA
+        # and translate to elastic center, out of place so the inputs are left untouched
+        x_ec_cs, y_ec_cs = y_ec, x_ec
+        EIxx_cs = EIyy - y_ec_cs**2 * EA
+        EIyy_cs = EIxx - x_ec_cs**2 * EA
+        EIxy_cs = EIxy - x_ec_cs * y_ec_cs * EA
 
         # get rotation angle
         alpha = 0.5 * np.arctan2(2 * EIxy_cs, (EIyy_cs - EIxx_cs))
 
         # get moments and positions in principal axes
-        EI11 = EIxx_cs - EIxy_cs * np.tan(alpha)
-        EI22 = EIyy_cs + EIxy_cs * np.tan(alpha)
+        EIxy_tan = EIxy_cs * np.tan(alpha)
+        EI11 = EIxx_cs - EIxy_tan
+        EI22 = EIyy_cs + EIxy_tan
 
         # Now store alpha for later use in degrees
         alpha = np.rad2deg(alpha)
 
         # Frame3dd call
         # ------- node data ----------------
-        n = len(z_az)
+        n = len(r)
         rad = np.zeros(n)  # 'radius' of rigidity at node- set to zero
         inode = 1 + np.arange(n)  # Node numbers (1-based indexing)
         # Frame3DD does a coordinate rotation for the local axis and when x_az is negative for precurve, this makes the local axis
@@ -448,6 +562,22 @@ class RunFrame3DD(ExplicitComponent):
         blade.enableDynamics(2 * self.n_freq, Mmethod, lump, tol, shift)
         # ----------------------------
 
+        return blade, alpha, EI11, EI22
+
+    def compute(self, inputs, outputs):
+        r = inputs["r"]
+        Px_af = inputs["Px_af"]
+        Py_af = inputs["Py_af"]
+        Pz_af = inputs["Pz_af"]
+
+        # The frame only depends on the section properties, so reuse it when just the loads change (e.g. finite differencing)
+        blade, alpha, EI11, EI22 = util.memo_inputs(self, self._frame_inputs, inputs, self._build_frame)
+        blade.clearLoadCases()
+
+        n = len(r)
+        L = np.diff(r)
+        elem = np.arange(1, n)  # Element Numbers
+
         # ------ load case 1, blade 1 ------------
         # trapezoidally distributed loads- already has gravity, centrifugal, aero, etc.
         gx = gy = gz = 0.0
@@ -498,8 +628,8 @@ class RunFrame3DD(ExplicitComponent):
         M2 = np.r_[-forces.Mzz[iCase, 0], forces.Mzz[iCase, 1::2]]
 
         # Store outputs
-        outputs["root_F"] = -1.0 * np.array([reactions.Fx.sum(), reactions.Fy.sum(), reactions.Fz.sum()])
-        outputs["root_M"] = -1.0 * np.array([reactions.Mxx.sum(), reactions.Myy.sum(), reactions.Mzz.sum()])
+        outputs["root_F"] = np.array([-reactions.Fx.sum(), -reactions.Fy.sum(), -reactions.Fz.sum()])
+        outputs["root_M"] = np.array([-reactions.Mxx.sum(), -reactions.Myy.sum(), -reactions.Mzz.sum()])
         outputs["freqs"] = modal.freq[: self.n_freq]
         outputs["edge_mode_shapes"] = mshapes_y
         outputs["flap_mode_shapes"] = mshapes_x
@@ -686,11 +816,12 @@ class ComputeStrains(ExplicitComponent):
             y2 = -x * sa + y * ca
             return x2, y2
 
-        def strain(xu, yu, xl, yl, M1in=M1_principle, M2in=M2_principle, F3in=F3_principle):
-            # use profile c.s. to use Hansen's notation
-            xuu, yuu = yu, xu
-            xll, yll = yl, xl
+        # ----- strains along the mid-line of the spar caps and at the center of the two trailing edge reinforcement thickness (not the trailing edge) -----
+        # Critical points stacked as rows (spar U, spar L, te U, te L), switched to the profile c.s. to use
+        # Hansen's notation and rotated into the principal axes once for all load cases
+        x_p, y_p = rotate(np.array([yu_spar, yl_spar, yu_te, yl_te]), np.array([xu_spar, xl_spar, xu_te, xl_te]))
 
+        def strain(M1in, M2in, F3in):
             # convert to principal axes, unless already there
             if self.options["pbeam"]:
                 M1, M2 = rotate(M2in, M1in)
@@ -698,65 +829,38 @@ class ComputeStrains(ExplicitComponent):
                 M1, M2 = M1in, M2in
 
             # compute strain
-            x, y = rotate(xuu, yuu)
-            strainU = M1 / EI11 * y - M2 / EI22 * x - F3in / EA
-
-            x, y = rotate(xll, yll)
-            strainL = M1 / EI11 * y - M2 / EI22 * x - F3in / EA
-
-            return strainU, strainL
-
-        # ----- strains along the mid-line of the spar caps and at the center of the two trailing edge reinforcement thickness (not the trailing edge) -----
-        strainU_spar, strainL_spar = strain(xu_spar, yu_spar, xl_spar, yl_spar)
-        strainU_te, strainL_te = strain(xu_te, yu_te, xl_te, yl_te)
+            return M1 / EI11 * y_p - M2 / EI22 * x_p - F3in / EA
 
-        outputs["strainU_spar"] = strainU_spar
-        outputs["strainL_spar"] = strainL_spar
-        outputs["strainU_te"] = strainU_te
-        outputs["strainL_te"] = strainL_te
+        outputs["strainU_spar"], outputs["strainL_spar"], outputs["strainU_te"], outputs["strainL_te"] = strain(
+            M1_principle, M2_principle, F3_principle
+        )
 
         # Sensitivities for fatigue calculation
         Espar = E  # Can update with rotor_elasticity later TODO
         Ete = E  # Can update with rotor_elasticity later TODO
-        ax_sparU_load2stress = np.zeros((n_sec, 6))
-        ax_sparL_load2stress = np.zeros((n_sec, 6))
-        ax_teU_load2stress = np.zeros((n_sec, 6))
-        ax_teL_load2stress = np.zeros((n_sec, 6))
+        E_p = np.array([Espar, Espar, Ete, Ete])
+        ax_load2stress = np.zeros((4, n_sec, 6))  # spar U, spar L, te U, te L
 
         # Unit load response for Mxx
         Fz = np.zeros(M1_principle.shape)  # axial
         Mxx = np.ones(M1_principle.shape)  # edgewise
         Myy = np.zeros(M1_principle.shape)  # flapwise
         M1p, M2p = rotate(Myy, Mxx)
-        strainU_spar_p, strainL_spar_p = strain(xu_spar, yu_spar, xl_spar, yl_spar, M1in=M1p, M2in=M2p, F3in=Fz)
-        strainU_te_p, strainL_te_p = strain(xu_te, yu_te, xl_te, yl_te, M1in=M1p, M2in=M2p, F3in=Fz)
-        ax_sparU_load2stress[:, 3] = Espar * strainU_spar_p
-        ax_sparL_load2stress[:, 3] = Espar * strainL_spar_p
-        ax_teU_load2stress[:, 3] = Ete * strainU_te_p
-        ax_teL_load2stress[:, 3] = Ete * strainL_te_p
+        ax_load2stress[:, :, 3] = E_p * strain(M1p, M2p, Fz)
 
         # Unit load response for Myy
         Mxx = np.zeros(M1_principle.shape)  # edgewise
         Myy = np.ones(M1_principle.shape)  # flapwise
         M1p, M2p = rotate(Myy, Mxx)
-        strainU_spar_p, strainL_spar_p = strain(xu_spar, yu_spar, xl_spar, yl_spar, M1in=M1p, M2in=M2p, F3in=Fz)
-        strainU_te_p, strainL_te_p = strain(xu_te, yu_te, xl_te, yl_te, M1in=M1p, M2in=M2p, F3in=Fz)
-        ax_sparU_load2stress[:, 4] = Espar * strainU_spar_p
-        ax_sparL_load2stress[:, 4] = Espar * strainL_spar_p
-        ax_teU_load2stress[:, 4] = Ete * strainU_te_p
-        ax_teL_load2stress[:, 4] = Ete * strainL_te_p
+        ax_load2stress[:, :, 4] = E_p * strain(M1p, M2p, Fz)
 
         # Unit load response for Fzz
         Fz = np.ones(M1_principle.shape)  # axial
         Mxx = np.zeros(M1_principle.shape)  # edgewise
         Myy = np.zeros(M1_principle.shape)  # flapwise
         M1p, M2p = rotate(Myy, Mxx)
-        strainU_spar_p, strainL_spar_p = strain(xu_spar, yu_spar, xl_spar, yl_spar, M1in=M1p, M2in=M2p, F3in=Fz)
-        strainU_te_p, strainL_te_p = strain(xu_te, yu_te, xl_te, yl_te, M1in=M1p, M2in=M2p, F3in=Fz)
-        ax_sparU_load2stress[:, 2] = Espar * strainU_spar_p
-        ax_sparL_load2stress[:, 2] = Espar * strainL_spar_p
-        ax_teU_load2stress[:, 2] = Ete * strainU_te_p
-        ax_teL_load2stress[:, 2] = Ete * strainL_te_p
+        ax_load2stress[:, :, 2] = E_p * strain(M1p, M2p, Fz)
+        ax_sparU_load2stress, ax_sparL_load2stress, ax_teU_load2stress, ax_teL_load2stress = ax_load2stress
 
         imaxc = np.argmax(inputs["chord"])
         outputs["axial_root_sparU_load2stress"] = ax_sparU_load2stress[0, :]
@@ -767,6 +871,8 @@ class ComputeStrains(ExplicitComponent):
 
 class TipDeflection(ExplicitComponent):
     # OpenMDAO component that computes the blade deflection at tip in yaw x-direction
+    _tip_inputs = ("dx_tip", "dy_tip", "dz_tip", "pitch_load", "tilt", "3d_curv_tip")
+
     def setup(self):
         # Inputs
         self.add_input("dx_tip", val=0.0, units="m", desc="deflection at tip in blade x-direction")
@@ -782,21 +888,46 @@ class TipDeflection(ExplicitComponent):
         # Outputs
         self.add_output("tip_deflection", val=0.0, units="m", desc="deflection at tip in yaw x-direction")
 
-    def compute(self, inputs, outputs):
+        # The rotation chain in DirectionVector carries its own derivatives, so the Jacobian is exact
+        self.declare_partials(
+            "tip_deflection",
+            ["dx_tip", "dy_tip", "dz_tip", "pitch_load", "tilt", "3d_curv_tip", "dynamicFactor"],
+        )
+
+    def _build_tip_vector(self, inputs):
         dx = inputs["dx_tip"]
         dy = inputs["dy_tip"]
         dz = inputs["dz_tip"]
         pitch = inputs["pitch_load"]  # + inputs['theta_tip']
-        azimuth = 180.0  # The blade is assumed in front of the tower, although the loading may correspond to another azimuthal position
         tilt = inputs["tilt"]
         totalConeTip = inputs["3d_curv_tip"]
-        dynamicFactor = inputs["dynamicFactor"]
 
         dr = DirectionVector(dx, dy, dz)
 
-        delta = dr.airfoilToBlade(pitch).bladeToAzimuth(totalConeTip).azimuthToHub(azimuth).hubToYaw(tilt)
+        # The blade is assumed in front of the tower (azimuth of 180 deg), although the loading may correspond to
+        # another azimuthal position
+        return dr.airfoilToBlade(pitch).bladeToYawAzimuth180(totalConeTip, tilt)
+
+    def _tip_vector(self, inputs):
+        # compute_partials follows compute at the same point, so reuse the rotated vector and its derivatives
+        return util.memo_inputs(self, self._tip_inputs, inputs, self._build_tip_vector)
+
+    def compute(self, inputs, outputs):
+        delta = self._tip_vector(inputs)
+
+        outputs["tip_deflection"] = inputs["dynamicFactor"] * delta.x
+
+    def compute_partials(self, inputs, J):
+        delta = self._tip_vector(inputs)
+        dynamicFactor = inputs["dynamicFactor"]
 
-        outputs["tip_deflection"] = dynamicFactor * delta.x
+        J["tip_deflection", "dx_tip"] = dynamicFactor * delta.dx["dx"]
+        J["tip_deflection", "dy_tip"] = dynamicFactor * delta.dx["dy"]
+        J["tip_deflection", "dz_tip"] = dynamicFactor * delta.dx["dz"]
+        J["tip_deflection", "pitch_load"] = dynamicFactor * delta.dx["dtheta"]
+        J["tip_deflection", "3d_curv_tip"] = dynamicFactor * delta.dx["dprecone"]
+        J["tip_deflection", "tilt"] = dynamicFactor * delta.dx["dtilt"]
+        J["tip_deflection", "dynamicFactor"] = delta.x
 
 
 class DesignConstraints(ExplicitComponent):
@@ -952,12 +1083,8 @@ class DesignConstraints(ExplicitComponent):
         flap_f = inputs["flap_mode_freqs"]
         edge_f = inputs["edge_mode_freqs"]
         gamma = self.options["modeling_options"]["WISDEM"]["RotorSE"]["gamma_freq"]
-        outputs["constr_flap_f_margin"] = np.array(
-            [min([threeP - (2 - gamma) * f, gamma * f - threeP]) for f in flap_f]
-        ).flatten()
-        outputs["constr_edge_f_margin"] = np.array(
-            [min([threeP - (2 - gamma) * f, gamma * f - threeP]) for f in edge_f]
-        ).flatten()
+        outputs["constr_flap_f_margin"] = np.minimum(threeP - (2 - gamma) * flap_f, gamma * flap_f - threeP)
+        outputs["constr_edge_f_margin"] = np.minimum(threeP - (2 - gamma) * edge_f, gamma * edge_f - threeP)
 
 
 class BladeRootSizing(ExplicitComponent):
@@ -1030,19 +1157,17 @@ class BladeRootSizing(ExplicitComponent):
         )
 
     def compute(self, inputs, outputs):
-        Mxy = np.sqrt(inputs["root_M"][0] ** 2.0 + inputs["root_M"][1] ** 2.0)
+        Mxy = np.hypot(inputs["root_M"][0], inputs["root_M"][1])
 
         d_r = np.sqrt((48.0 * Mxy * inputs["s_f"]) / (np.pi**2.0 * inputs["sigma_max"] * inputs["d_f"]))
 
-        sectors = np.array([])
-        for i in range(self.n_layers):
-            sectors = np.unique(np.hstack([sectors, inputs["layer_start_nd"][i, 0], inputs["layer_end_nd"][i, 0]]))
+        # only the root station matters here
+        start_nd = inputs["layer_start_nd"][:, 0]
+        end_nd = inputs["layer_end_nd"][:, 0]
+        sectors = np.unique(np.hstack([start_nd, end_nd]))
 
-        thick = np.zeros(len(sectors))
-        for j in range(len(sectors)):
-            for i in range(self.n_layers):
-                if inputs["layer_start_nd"][i, 0] <= sectors[j] and inputs["layer_end_nd"][i, 0] >= sectors[j]:
-                    thick[j] += inputs["layer_thickness"][i, 0]
+        covers = (start_nd[np.newaxis, :] <= sectors[:, np.newaxis]) & (end_nd[np.newaxis, :] >= sectors[:, np.newaxis])
+        thick = covers @ inputs["layer_thickness"][:, 0]
 
         # check = np.all(thick == thick[0])
         # if not check:
@@ -1818,6 +1943,7 @@ class RotorStructure(Group):
             "nBlades",
             "rho",
             "mu",
+            "V_load",
             "Omega_load",
             "pitch_load",
             "shearExp",
@@ -65,7 +65,13 @@ class TestPlantFinance(unittest.TestCase):
             prob[k] = self.inputs[k]
         for k in self.discrete_inputs.keys():
             prob[k] = self.discrete_inputs[k]
-        # prob.check_partials()
+        prob.run_model()
+
+        # Only the LCOE partials are analytic
+        data = prob.check_partials(out_stream=None, method="fd", form="central")
+        for (of, wrt), err in data["pf"].items():
+            if of == "lcoe":
+                npt.assert_allclose(err["J_fwd"], err["J_fd"], rtol=1e-5, atol=1e-9, err_msg=wrt)
 
 
 def suite():
@@ -4,6 +4,7 @@ import unittest
 import numpy as np
 import openmdao.api as om
 import numpy.testing as npt
+from openmdao.utils.assert_utils import assert_check_partials
 
 import wisdem.rotorse.rotor_power as rp
 
@@ -82,6 +83,20 @@ class TestServo(unittest.TestCase):
         except ValueError:
             self.assertTrue(True)
 
+    def testAEPPartials(self):
+        n_pc = 20
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem("aep", rp.AEP(nspline=n_pc), promotes=["*"])
+        prob.setup(force_alloc_complex=True)
+        prob["P"] = 5e6 * np.sin(np.linspace(0.1, 1.5, n_pc))
+        prob["CDF_V"] = 1.0 - np.exp(-np.linspace(0.0, 3.0, n_pc))
+        prob["lossFactor"] = 0.9
+        prob.run_model()
+
+        npt.assert_almost_equal(prob["AEP"], 0.9 * 8.76 * np.trapz(prob["P"], prob["CDF_V"]))
+        data = prob.check_partials(out_stream=None, method="cs")
+        assert_check_partials(data, atol=1e-6, rtol=1e-8)
+
     def testRegulationTrajectory(self):
         prob = om.Problem(reports=False)
 
@@ -6,6 +6,7 @@ import unittest
 import numpy as np
 import openmdao.api as om
 import numpy.testing as npt
+from openmdao.utils.assert_utils import assert_check_partials
 
 import wisdem.rotorse.rotor_structure as rs
 from wisdem.commonse import gravity
@@ -15,6 +16,25 @@ ARCHIVE2 = os.path.dirname(os.path.abspath(__file__)) + os.path.sep + "nrel5mw_t
 
 
 class TestRS(unittest.TestCase):
+    def span_options(self, npts):
+        options = {}
+        options["WISDEM"] = {}
+        options["WISDEM"]["RotorSE"] = {}
+        options["WISDEM"]["RotorSE"]["n_span"] = npts
+        return options
+
+    def check_partials(self, comp, inputs, atol=1e-5):
+        # Compare the analytic partials of a single component against forward differences
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem("comp", comp, promotes=["*"])
+        prob.setup()
+        for k, v in inputs.items():
+            prob[k] = v
+        prob.run_model()
+
+        check = prob.check_partials(out_stream=None, compact_print=True, method="fd", step=1e-7)
+        assert_check_partials(check, atol=atol, rtol=1e-4)
+
     def testBladeCurvature(self):
         inputs = {}
         outputs = {}
@@ -81,6 +101,16 @@ class TestRS(unittest.TestCase):
         npt.assert_equal(outputs["y_az"], inputs["presweep"])
         npt.assert_equal(outputs["z_az"], inputs["r"])
 
+    def testBladeCurvaturePartials(self):
+        npts = 20
+        rr = np.linspace(0, 58, npts)
+        inputs = {}
+        inputs["r"] = 2.0 + rr
+        inputs["precurve"] = -1e-3 * rr**2
+        inputs["presweep"] = 5e-4 * rr**2
+        inputs["precone"] = 2.5
+        self.check_partials(rs.BladeCurvature(modeling_options=self.span_options(npts)), inputs)
+
     def testTotalLoads(self):
         inputs = {}
         outputs = {}
@@ -153,6 +183,24 @@ class TestRS(unittest.TestCase):
         npt.assert_almost_equal(outputs["Py_af"], inputs["aeroloads_Py"] - 20 * gravity)
         npt.assert_almost_equal(outputs["Pz_af"], inputs["aeroloads_Pz"] + 20 * inputs["r"] * (5 * 2 * np.pi / 60) ** 2)
 
+    def testTotalLoadsPartials(self):
+        npts = 20
+        rr = np.linspace(0, 58, npts)
+        inputs = {}
+        inputs["r"] = inputs["z_az"] = 2.0 + rr
+        inputs["aeroloads_Px"] = 3e3 * np.sin(rr / 20.0)
+        inputs["aeroloads_Py"] = -1e3 + 10.0 * rr
+        inputs["aeroloads_Pz"] = 50.0
+        inputs["aeroloads_Omega"] = 9.0
+        inputs["aeroloads_pitch"] = 4.0
+        inputs["aeroloads_azimuth"] = 35.0
+        inputs["theta"] = 15.0 - 0.3 * rr
+        inputs["tilt"] = 6.0
+        inputs["3d_curv"] = 2.5 - 0.05 * rr
+        inputs["rhoA"] = 600.0 - 8.0 * rr
+        inputs["dynamicFactor"] = 1.2
+        self.check_partials(rs.TotalLoads(modeling_options=self.span_options(npts)), inputs, atol=1e-3)
+
     def testRunFrame3DD(self):
         inputs = {}
         outputs = {}
@@ -484,6 +532,17 @@ class TestRS(unittest.TestCase):
         npt.assert_almost_equal(outputs["axial_maxc_teL_load2stress"][3], -E * y_te / inputs["EI11"][k], decimal=3)
         npt.assert_almost_equal(outputs["axial_maxc_teL_load2stress"][4], E * x_te / inputs["EI22"][k], decimal=3)
 
+    def testTipDeflectionPartials(self):
+        inputs = {}
+        inputs["dx_tip"] = 4.5
+        inputs["dy_tip"] = -0.8
+        inputs["dz_tip"] = 0.1
+        inputs["pitch_load"] = 3.0
+        inputs["tilt"] = 6.0
+        inputs["3d_curv_tip"] = 2.5
+        inputs["dynamicFactor"] = 1.2
+        self.check_partials(rs.TipDeflection(), inputs)
+
     def testConstraints(self):
         inputs = {}
         outputs = {}